@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark the organizer on synthetic card and archive trees.
+Clips are sparse files, so large sizes cost almost no disk space. Each phase is
+timed separately and the results are printed as JSON that can be compared across commits:
+
+    python benchmark_organizer.py --clips 200 --archive 2000 > before.json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import subprocess
+import logging
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add current directory to path so we can import organize_videos
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import organize_videos
+
+MARKER_SIZE = 4096  # Random bytes written at the head, middle and tail of each sparse clip
+COUNTED_CALLS = ("stat", "lstat", "scandir", "rename", "replace", "utime", "unlink")
+
+def write_clip(path: Path, size: int, seed: int, timestamp: float):
+    """Create a sparse clip whose head, middle and tail hold content derived from seed."""
+    rng = random.Random(seed)
+    with open(path, 'wb') as f:
+        f.truncate(size)
+        for offset in {0, max(size // 2 - MARKER_SIZE, 0), max(size - MARKER_SIZE, 0)}:
+            f.seek(offset)
+            f.write(rng.randbytes(min(MARKER_SIZE, size)))
+    os.utime(path, (timestamp, timestamp))
+
+def build_trees(root: Path, args) -> dict:
+    """Create card/ with new clips and card/organized/ with an existing archive. Returns tree facts."""
+    rng = random.Random(args.seed)
+    card = root / "card"
+    organized = card / "organized"
+    organized.mkdir(parents=True)
+    base = datetime(2024, 5, 1, 9, 0)
+    size = int(args.size_mb * 1024 * 1024)
+
+    archive = []
+    for i in range(args.archive):
+        day = base - timedelta(days=1 + i % args.days)
+        recorded = day + timedelta(minutes=rng.uniform(0, args.spread_minutes))
+        folder = organized / day.strftime("%Y-%m-%d")
+        folder.mkdir(exist_ok=True)
+        original = f"GX{i:06d}"
+        if rng.random() < args.renamed_ratio:
+            name = f"Jump {i % 9 + 1} - Video {i % 3 + 1} - {recorded.strftime('%H-%M')} ({original}).MP4"
+        else:
+            name = f"{original}.MP4"
+        clip_size = size + rng.randrange(0, 1024 * 1024)
+        write_clip(folder / name, clip_size, i, recorded.timestamp())
+        archive.append((clip_size, i, recorded))
+
+    duplicates = 0
+    for i in range(args.clips):
+        path = card / f"GX{args.archive + i:06d}.MP4"
+        if archive and rng.random() < args.duplicate_ratio:
+            # Same content as an archive clip, but possibly re-dated by a copy tool
+            clip_size, seed, recorded = rng.choice(archive)
+            write_clip(path, clip_size, seed, (recorded + timedelta(days=rng.choice([0, 1]))).timestamp())
+            duplicates += 1
+        else:
+            recorded = base + timedelta(minutes=rng.uniform(0, args.spread_minutes))
+            write_clip(path, size + rng.randrange(0, 1024 * 1024), args.archive + i, recorded.timestamp())
+
+    busiest = max((d for d in organized.iterdir() if d.is_dir()), key=lambda d: len(os.listdir(d)), default=None)
+    return {"card": card, "organized": organized, "busiest": busiest, "duplicates": duplicates}
+
+def read_proc_io() -> dict:
+    """Read counters from /proc/self/io where the platform has it (Linux)."""
+    try:
+        with open("/proc/self/io") as f:
+            return {key: int(value) for key, value in (line.split(": ") for line in f)}
+    except OSError:
+        return {}
+
+class CallCounter:
+    """Counts calls to selected os functions while a phase runs."""
+
+    def __init__(self):
+        self.counts = {name: 0 for name in COUNTED_CALLS}
+        self.originals = {}
+
+    def __enter__(self):
+        for name in COUNTED_CALLS:
+            original = getattr(os, name)
+            self.originals[name] = original
+
+            def counted(*args, _name=name, _original=original, **kwargs):
+                self.counts[_name] += 1
+                return _original(*args, **kwargs)
+            setattr(os, name, counted)
+        return self
+
+    def __exit__(self, *exc):
+        for name, original in self.originals.items():
+            setattr(os, name, original)
+
+def measure(function, *args) -> dict:
+    """Run one phase and return its wall time, I/O counters and os call counts."""
+    io_before = read_proc_io()
+    with CallCounter() as counter:
+        start = time.perf_counter()
+        function(*args)
+        seconds = time.perf_counter() - start
+    io_after = read_proc_io()
+
+    result = {"seconds": round(seconds, 6), "calls": counter.counts}
+    if io_before and io_after:
+        result["bytes_read"] = io_after["rchar"] - io_before["rchar"]
+        result["read_syscalls"] = io_after["syscr"] - io_before["syscr"]
+        result["write_syscalls"] = io_after["syscw"] - io_before["syscw"]
+    return result
+
+def group_tuples(video_files, threshold):
+    """The (Path, datetime) tuple version of group_videos_by_time that VideoRecord replaced, for comparison."""
+    sorted_videos = sorted(video_files, key=lambda x: x[1])
+    groups = []
+    current_group = sorted_videos[:1]
+    for video in sorted_videos[1:]:
+        if video[1] - current_group[-1][1] <= threshold:
+            current_group.append(video)
+        else:
+            groups.append(current_group)
+            current_group = [video]
+    if current_group:
+        groups.append(current_group)
+    return groups
+
+def compare_records(folder: Path, count: int, args) -> dict:
+    """Memory to hold count clips as (Path, datetime) tuples and as VideoRecords, and time to group each."""
+    rng = random.Random(args.seed)
+    base = datetime(2024, 5, 1, 9, 0)
+    times = [base + timedelta(minutes=rng.uniform(0, args.spread_minutes)) for _ in range(count)]
+    result = {"count": count}
+    for kind in ("tuples", "records"):
+        tracemalloc.start()
+        if kind == "tuples":
+            items = [(folder / f"GX{i:06d}.MP4", recorded) for i, recorded in enumerate(times)]
+        else:
+            items = [organize_videos.VideoRecord(str(folder), f"GX{i:06d}.MP4",
+                                                 (recorded - organize_videos.RECORD_EPOCH).total_seconds())
+                     for i, recorded in enumerate(times)]
+        result[f"{kind}_bytes"] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        start = time.perf_counter()
+        if kind == "tuples":
+            group_tuples(items, organize_videos.JUMP_TIME_THRESHOLD)
+        else:
+            organize_videos.group_videos_by_time(items)
+        result[f"{kind}_group_seconds"] = round(time.perf_counter() - start, 6)
+        del items
+    return result
+
+def measure_plan(folder: Path) -> dict:
+    """Memory held by the plan_folder() result for a real date folder, and the peak while planning it."""
+    tracemalloc.start()
+    clips = organize_videos.plan_folder(folder)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"clips": len(clips), "retained_bytes": retained, "peak_bytes": peak}
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        return ""
+
+def run_once(root: Path, args) -> dict:
+    tree = build_trees(root, args)
+    card, organized = tree["card"], tree["organized"]
+    card_clips = sorted(p for p in card.iterdir() if p.is_file())
+
+    phases = {}
+    phases["get_quick_file_signature"] = measure(
+        lambda: [organize_videos.get_quick_file_signature(p) for p in card_clips])
+    # The dedupe path the organizer runs: a cold index build, a stat-only refresh and one check per card clip.
+    # The index is removed afterwards so organize_videos below starts from the same state as before.
+    index = organize_videos.SignatureIndex(organized)
+    phases["index_refresh_cold"] = measure(index.refresh)
+    phases["index_refresh_warm"] = measure(index.refresh)
+    detector = organize_videos.DuplicateDetector(index)
+    phases["duplicate_check"] = measure(lambda: [detector.check(p) for p in card_clips])
+    phases["duplicate_check"]["resolved"] = dict(detector.resolved)
+    index.close()
+    shutil.rmtree(organized / organize_videos.INDEX_DIR_NAME)
+
+    rng = random.Random(args.seed)
+    base = datetime(2024, 5, 1, 9, 0)
+    timed_videos = [organize_videos.VideoRecord.from_path(
+                        card / f"clip{i}.MP4", base + timedelta(minutes=rng.uniform(0, args.spread_minutes)))
+                    for i in range(args.group_size)]
+    phases["group_videos_by_time"] = measure(organize_videos.group_videos_by_time, timed_videos)
+
+    if tree["busiest"] is not None:
+        phases["rename_videos_in_directory"] = measure(organize_videos.rename_videos_in_directory, tree["busiest"])
+
+    organize_videos.SOURCE_DIR = str(card)
+    phases["organize_videos"] = measure(organize_videos.organize_videos)
+    records = compare_records(organized, args.record_count, args)
+    if tree["busiest"] is not None:
+        records["plan_folder"] = measure_plan(tree["busiest"])
+    return {"duplicates": tree["duplicates"], "phases": phases, "video_records": records}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the video organizer on synthetic trees.")
+    parser.add_argument("--clips", type=int, default=100, help="New clips on the synthetic card")
+    parser.add_argument("--archive", type=int, default=500, help="Clips already in organized/")
+    parser.add_argument("--days", type=int, default=10, help="Date folders the archive is spread over")
+    parser.add_argument("--size-mb", type=float, default=64, help="Approximate clip size in MB (sparse)")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.1, help="Share of card clips already archived")
+    parser.add_argument("--renamed-ratio", type=float, default=0.5,
+                        help="Share of archive clips already named 'Jump N - Video M'")
+    parser.add_argument("--spread-minutes", type=float, default=240, help="Recording time spread within a day")
+    parser.add_argument("--group-size", type=int, default=10000, help="Clips passed to group_videos_by_time")
+    parser.add_argument("--record-count", type=int, default=100000,
+                        help="Clips held as tuples and as VideoRecords to compare memory and grouping time")
+    parser.add_argument("--workers", type=int, default=organize_videos.INGEST_WORKERS, help="Ingest workers")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs, each on a freshly generated tree")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--dir", help="Where to build the trees (default: a temporary directory)")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    organize_videos.logger.setLevel(logging.WARNING)
+    organize_videos.INGEST_WORKERS = args.workers
+
+    runs = []
+    for _ in range(args.repeat):
+        root = Path(tempfile.mkdtemp(prefix="organizer-bench-", dir=args.dir))
+        try:
+            runs.append(run_once(root, args))
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    report = {
+        "commit": git_commit(),
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "parameters": {key: value for key, value in vars(args).items() if key not in ("dir", "output")},
+        "runs": runs,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
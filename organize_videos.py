@@ -2,13 +2,30 @@
 
 import os
 import shutil
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import hashlib
-from typing import Set, Dict, Tuple, List
+from typing import Set, Dict, Tuple, List, Optional, NamedTuple, Callable, TYPE_CHECKING
 import logging
 import sys
 import json
+import argparse
+import mmap
+import struct
+import time
+import errno
+import select
+import ctypes
+import ctypes.util
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import sqlite3
+import threading
+import queue
+from operator import attrgetter
+
+if TYPE_CHECKING:
+    import numpy  # Only needed for archive regrouping, so it is imported where that runs
 
 # Configure logging to use stdout
 logging.basicConfig(
@@ -16,56 +33,987 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s',
     stream=sys.stdout  # Use stdout instead of stderr
 )
-logger = logging.getLogger(__name__)
+class _RunLogger:
+    """
+    The module logger. Messages go to the logger configured for the run the current thread
+    is working for (OrganizerConfig.logger), so runs in parallel can log to different places,
+    and to the standard module logger otherwise.
+    """
+
+    def __init__(self, base: logging.Logger):
+        self.base = base
+
+    def __getattr__(self, name):
+        run = _current_run()
+        target = run.config.logger if run is not None and run.config.logger is not None else self.base
+        return getattr(target, name)
+
+logger = _RunLogger(logging.getLogger(__name__))
 
 # Constants
 VERSION = "1.0.0"
-SOURCE_DIR = ""  # Will be set by GUI or command line argument
+SOURCE_DIR = ""  # Default source directory for runs whose config names none
 VIDEO_EXTENSIONS = {'.mp4', '.mov', '.MP4', '.MOV'}  # Add more if needed
 JUMP_TIME_THRESHOLD = timedelta(minutes=20)  # Videos within this time are considered same jump
 QUICK_HASH_SIZE = 1024 * 1024  # Read first 1MB for quick comparison
+SIGNATURE_MODE = "digest"  # "digest" (sampled BLAKE2b) or "header" (raw first QUICK_HASH_SIZE bytes)
+SIGNATURE_SAMPLE_POINTS = (0.0, 0.5, 1.0)  # Relative file positions sampled for the digest (head, middle, tail)
+SIGNATURE_SAMPLE_SIZE = QUICK_HASH_SIZE // 4  # Bytes read at each sample point
+SIGNATURE_DIGEST_SIZE = 16  # Bytes in the BLAKE2b digest
+MP4_EPOCH = datetime(1904, 1, 1, tzinfo=timezone.utc)  # Zero point of MP4/MOV container timestamps
+RECORD_EPOCH = datetime(1970, 1, 1)  # Zero point of VideoRecord timestamps, in the same naive local clock as the dates
+MP4_TOP_LEVEL_ATOMS = {b'ftyp', b'moov', b'mdat', b'free', b'skip', b'wide', b'uuid', b'pnot'}
+CONTAINER_TIMES_ARE_UTC = False  # GoPro cameras write local time into the container; True for cameras that follow the spec (UTC)
+DATE_CORRECTION_REFERENCE = None  # Real recording time (datetime) of the earliest clip with an unset camera clock
+DATE_CORRECTION_REFERENCE_CLIP = ""  # Or: a clip with a trustworthy time recorded at the same moment as that clip
+DATE_CORRECTION_SOURCE_REFERENCES = {}  # Per source directory: real recording time of its earliest clip with an unset clock
+DATE_CORRECTION_PROMPT = False  # Ask once on the command line for the reference time if neither is set
 PRESERVE_NAMES = True  # Whether to preserve original names in parentheses
+DEDUPE_ACROSS_ARCHIVE = True  # Look for duplicates in every date folder, not just the target one
+RENUMBER_ALL = False  # Renumber jumps in every date folder instead of only the ones that changed
+VERIFY_TRANSFERS = False  # Hash copied files and compare before deleting the source
+TRANSFER_CHUNK_SIZE = 16 * 1024 * 1024  # Bytes per copy call when moving files between devices
+DEVICE_STREAMS = 1  # Bulk copies and full-file hashes run at once per device (st_dev); raise for SSDs
+PARTIAL_SUFFIX = ".partial"  # Suffix of files being copied, renamed into place once complete
+COPY_MODE = False  # Keep the source files: reflink or hardlink them into organized/ where possible, else copy
+FICLONE = 0x40049409  # Linux ioctl sharing a file's data blocks with a new file (btrfs, XFS, bcachefs)
+WATCH_SETTLE_SECONDS = 5.0  # Watch mode: seconds a file's size and mtime must be stable before ingesting
+WATCH_POLL_INTERVAL = 2.0  # Watch mode: seconds between scans when polling
+INOTIFY_MASK = 0x2 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200  # IN_MODIFY, IN_CLOSE_WRITE, IN_MOVED_FROM/TO, IN_CREATE, IN_DELETE
+SCAN_SUBFOLDERS = False  # Also look inside camera subfolders such as DCIM/100GOPRO
+INGEST_WORKERS = 1  # Worker threads per ingest stage; 1 processes files one at a time
+INGEST_QUEUE_SIZE = 8  # Files buffered between ingest stages when running concurrently
+INDEX_DIR_NAME = ".index"  # Folder inside organized/ holding the persistent signature index
+INDEX_DB_NAME = "signatures.db"
+INDEX_SCHEMA_VERSION = 2
+FULL_HASH_CHUNK_SIZE = 8 * 1024 * 1024  # Read size when hashing whole files to confirm duplicates
+RUN_REPORT_NAME = "last_run.json"  # Run report written to organized/.index/ after each run
+RUN_REPORT_PATH = ""  # Extra location to write the run report to, if set
+JOURNAL_NAME = "journal.jsonl"  # Write-ahead journal of moves and renumbering in organized/.index/
+JOURNAL_FINISHED_STATES = ("done", "rolled_back", "skipped")
+RENAME_SUFFIX = ".renaming"  # Suffix of the hidden temporary names used while renumbering a folder
+THUMBNAILS = False  # After renumbering, build a thumbnail strip per jump and a contact sheet per date folder
+THUMBNAIL_DIR_NAME = ".thumbnails"  # Folder inside organized/ holding <date>/Jump N.jpg and <date>/contact_sheet.jpg
+THUMBNAIL_CACHE_NAME = "thumbnails"  # Folder in organized/.index/ caching one frame per clip, named by its signature
+THUMBNAIL_SIZE = (320, 180)  # Width and height of each frame; other aspect ratios are letterboxed
+THUMBNAIL_SEEK_SECONDS = 3.0  # Position of the frame taken from each clip (the start is used for shorter clips)
+THUMBNAIL_WORKERS = 4  # ffmpeg processes run at once
+PROXY_EXTENSIONS = ('.LRV', '.lrv')  # Low-resolution proxies GoPro cameras write next to each clip
+MANIFEST_NAME = ".manifest.json"  # Per date folder: every clip's names, recording time, jump and digest
+MANIFEST_VERSION = 1
+
+class RunReport:
+    """
+    Wall time, files and bytes read per phase of a run, plus throughput and latency of the moves.
+    Phases run one after another; reads are charged to whichever phase is active.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = datetime.now()
+        self.phases = {}
+        self.current_phase = None
+        self.move_bytes = []
+        self.move_seconds = []
+        self.move_methods = {}
+        self.cancelled = False
+        self.metadata_cache = {}
+        self.devices = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        with self.lock:
+            stats = self.phases.setdefault(name, {"seconds": 0.0, "files_read": 0, "bytes_read": 0})
+            previous, self.current_phase = self.current_phase, name
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self.lock:
+                stats["seconds"] += time.perf_counter() - start
+                self.current_phase = previous
+
+    def record_read(self, num_bytes: int, files: int = 1):
+        with self.lock:
+            if self.current_phase is not None:
+                stats = self.phases[self.current_phase]
+                stats["files_read"] += files
+                stats["bytes_read"] += num_bytes
+
+    def record_move(self, num_bytes: int, seconds: float, method: str = ""):
+        with self.lock:
+            self.move_bytes.append(num_bytes)
+            self.move_seconds.append(seconds)
+            if method:
+                self.move_methods[method] = self.move_methods.get(method, 0) + 1
+
+    def to_dict(self) -> dict:
+        with self.lock:
+            latencies = sorted(self.move_seconds)
+            total_bytes = sum(self.move_bytes)
+            total_seconds = sum(self.move_seconds)
+
+            def percentile(fraction: float) -> float:
+                return round(latencies[min(int(len(latencies) * fraction), len(latencies) - 1)], 6) if latencies else 0.0
+
+            return {
+                "started": self.started.isoformat(timespec='seconds'),
+                "cancelled": self.cancelled,
+                "metadata_cache": dict(self.metadata_cache),
+                "devices": dict(self.devices),
+                "phases": {name: {**stats, "seconds": round(stats["seconds"], 6)} for name, stats in self.phases.items()},
+                "moves": {
+                    "files": len(latencies),
+                    "bytes": total_bytes,
+                    "seconds": round(total_seconds, 6),
+                    "mb_per_second": round(total_bytes / (1024 * 1024) / total_seconds, 2) if total_seconds else 0.0,
+                    "latency_p50": percentile(0.5),
+                    "latency_p90": percentile(0.9),
+                    "latency_p99": percentile(0.99),
+                    "latency_max": round(latencies[-1], 6) if latencies else 0.0,
+                    "methods": dict(self.move_methods),
+                },
+            }
+
+    def summary(self) -> str:
+        phases = ", ".join(f"{name} {stats['seconds']:.1f}s ({stats['files_read']} files, "
+                           f"{stats['bytes_read'] / (1024 * 1024):.1f} MB read)"
+                           for name, stats in self.phases.items())
+        lines = [f"Run phases: {phases}"]
+        for device, stats in self.devices.items():
+            lines.append(f"Device {device} ({stats['path']}): {stats['streams']} streams, "
+                         f"{stats['bytes'] / (1024 * 1024):.1f} MB at {stats['mb_per_second']:.1f} MB/s, "
+                         f"{stats['metadata_ops']} metadata ops, queue depth up to {stats['max_queue_depth']}, "
+                         f"waited {stats['wait_seconds']:.1f}s")
+        return "\n".join(lines)
+
+    def write(self, organized_dir: Path, extra_path: str = "") -> dict:
+        """Write the report as JSON to organized/.index/ (and extra_path if set) and return it."""
+        report = self.to_dict()
+        text = json.dumps(report, indent=2)
+        targets = [organized_dir / INDEX_DIR_NAME / RUN_REPORT_NAME]
+        if extra_path:
+            targets.append(Path(extra_path))
+        for target in targets:
+            try:
+                target.write_text(text + "\n")
+            except OSError as e:
+                logger.error(f"Error writing run report to {target}: {e}")
+        return report
+
+class MetadataCache:
+    """
+    Stat results and recording dates of the files a run has seen, keyed by path and checked
+    against the inode so a different file reusing a path is never taken for the cached one.
+    The index refresh fills it with the archive and discovery with the new clips; moves and
+    renames re-key entries instead of dropping them, so renumbering a date folder lists it and
+    resolves recording times without statting or parsing the files again.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}  # path -> [stat result, recording date or None, source of the date or None]
+        self.hits = 0
+        self.misses = 0
+
+    def put(self, path: Path, stat_info: os.stat_result):
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None and entry[0].st_ino == stat_info.st_ino:
+                entry[0] = stat_info
+            else:
+                self.entries[path] = [stat_info, None, None]
+
+    def stat(self, path: Path, inode: Optional[int] = None) -> Optional[os.stat_result]:
+        """The cached stat of path, if any (and only if it is still the file with the given inode)."""
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None and (inode is None or entry[0].st_ino == inode):
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            return None
+
+    def set_date(self, path: Path, video_date: datetime, source: Optional[str] = None):
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None:
+                entry[1] = video_date
+                if source is not None:
+                    entry[2] = source
+
+    def video_date(self, path: Path, stat_info: os.stat_result) -> datetime:
+        """Recording date of path, resolved with get_video_date_with_source() only the first time."""
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None and entry[1] is not None and entry[0].st_ino == stat_info.st_ino:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        video_date, source = get_video_date_with_source(path, stat_info)
+        with self.lock:
+            self.entries[path] = [stat_info, video_date, source]
+        return video_date
+
+    def date_source(self, path: Path) -> Optional[str]:
+        """Where the cached recording date of path came from (see get_video_date_with_source), if known."""
+        with self.lock:
+            entry = self.entries.get(path)
+            return entry[2] if entry is not None else None
+
+    def move(self, old_path: Path, new_path: Path, stat_info: Optional[os.stat_result] = None):
+        """Follow a file to its new path, with its new stat if the move changed it (a copy across devices)."""
+        with self.lock:
+            entry = self.entries.pop(old_path, None)
+            if entry is not None:
+                self.entries[new_path] = [stat_info or entry[0], entry[1], entry[2]]
+            elif stat_info is not None:
+                self.entries[new_path] = [stat_info, None, None]
+
+    def to_dict(self) -> dict:
+        with self.lock:
+            return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
+
+class IOScheduler:
+    """
+    Caps bulk streaming work (copies and full-file hashes) at a number of operations per device,
+    keyed by st_dev, so copies onto one spinning drive queue up instead of thrashing it while
+    copies between other drives go ahead in parallel. An operation holds a slot on every device
+    it touches, taken all at once so two operations can't each hold half of what they need.
+    Metadata-only work (renames, links, stats, signature samples) never waits here, so it runs
+    ahead of queued copies. Queue depth and throughput are kept per device for the run report.
+    """
+
+    def __init__(self, streams_per_device: int):
+        self.limit = max(1, streams_per_device)
+        self.condition = threading.Condition()
+        self.active = {}  # st_dev -> streaming operations running
+        self.waiting = {}  # st_dev -> streaming operations queued
+        self.devices = {}  # st_dev -> statistics
+        self.held = threading.local()  # Devices the current thread holds slots on, so nested work doesn't wait on itself
+
+    def _stats(self, device: int, path: Optional[Path] = None) -> dict:
+        stats = self.devices.get(device)
+        if stats is None:
+            stats = self.devices[device] = {"path": str(path) if path else "", "streams": 0, "metadata_ops": 0,
+                                            "bytes": 0, "busy_seconds": 0.0, "wait_seconds": 0.0,
+                                            "max_queue_depth": 0}
+        return stats
+
+    @contextmanager
+    def streaming(self, devices: Dict[int, Path]):
+        """
+        Hold a streaming slot on each device (st_dev -> a path on it, for the report) for the
+        duration of the block. Yields a function the block reports the bytes it moved to.
+        """
+        held = getattr(self.held, "devices", None)
+        if held is None:
+            held = self.held.devices = set()
+        needed = sorted(device for device in devices if device not in held)
+        start = time.monotonic()
+        with self.condition:
+            for device in needed:
+                self.waiting[device] = self.waiting.get(device, 0) + 1
+                stats = self._stats(device, devices[device])
+                stats["max_queue_depth"] = max(stats["max_queue_depth"],
+                                               self.waiting[device] + self.active.get(device, 0))
+            try:
+                while not all(self.active.get(device, 0) < self.limit for device in needed):
+                    self.condition.wait(0.5)
+                    _raise_if_cancelled()
+            finally:
+                for device in needed:
+                    self.waiting[device] -= 1
+            for device in needed:
+                self.active[device] = self.active.get(device, 0) + 1
+        held.update(needed)
+        granted = time.monotonic()
+        moved = [0]
+
+        def record(num_bytes: int):
+            moved[0] += num_bytes
+        try:
+            yield record
+        finally:
+            held.difference_update(needed)
+            finished = time.monotonic()
+            with self.condition:
+                for device in needed:
+                    self.active[device] -= 1
+                for device in needed:
+                    # Work nested in a slot this thread already holds (verifying a copy) counts towards that slot
+                    stats = self._stats(device, devices[device])
+                    stats["bytes"] += moved[0]
+                    stats["streams"] += 1
+                    stats["busy_seconds"] += finished - granted
+                    stats["wait_seconds"] += granted - start
+                self.condition.notify_all()
+
+    def metadata(self, devices: Dict[int, Path]):
+        """Count a metadata-only operation (rename, link) on each device; it doesn't wait for a slot."""
+        with self.condition:
+            for device, path in devices.items():
+                self._stats(device, path)["metadata_ops"] += 1
+
+    def to_dict(self) -> dict:
+        with self.condition:
+            return {str(device): {**stats, "busy_seconds": round(stats["busy_seconds"], 6),
+                                  "wait_seconds": round(stats["wait_seconds"], 6),
+                                  "mb_per_second": round(stats["bytes"] / (1024 * 1024) / stats["busy_seconds"], 2)
+                                  if stats["busy_seconds"] else 0.0}
+                    for device, stats in self.devices.items()}
+
+class OrganizeCancelled(Exception):
+    """Raised inside a run once its cancellation token is set."""
+
+class CancellationToken:
+    """
+    Stops a run from another thread. The run checks the token between files, while reading
+    recording dates and refreshing the index, and between copy and hash chunks; a copy in progress is abandoned and its partial file removed, so the
+    source is left untouched and nothing half-moved ends up in organized/.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise OrganizeCancelled("Organization cancelled")
+
+class OrganizerConfig(NamedTuple):
+    """
+    Settings of one run, passed to every function that needs them instead of reading the
+    module-level constants, so runs with different settings can share a process.
+    Build one with OrganizerConfig.from_globals(), which starts from the constants and takes
+    overrides by keyword. Functions given no config use the constants as they are when called.
+    """
+    source_dirs: Tuple[str, ...]  # Ingested in parallel into one organized/ tree when there are several
+    organized_dir: str  # Defaults to organized/ inside the first source directory
+    video_extensions: frozenset
+    jump_time_threshold: timedelta
+    preserve_names: bool
+    dedupe_across_archive: bool
+    renumber_all: bool
+    verify_transfers: bool
+    container_times_are_utc: bool
+    device_streams: int  # Bulk copies and hashes at once per device (see IOScheduler)
+    copy_mode: bool
+    thumbnails: bool
+    scan_subfolders: bool
+    ingest_workers: int
+    date_correction_reference: Optional[datetime]
+    date_correction_reference_clip: str
+    date_correction_source_references: Dict[str, datetime]  # Source directory -> its own reference time
+    date_correction_prompt: bool
+    watch_settle_seconds: float
+    run_report_path: str
+    resume: bool  # Only finish the moves an interrupted run planned (see MoveJournal), without scanning
+    logger: Optional[logging.Logger]  # Receives the run's messages instead of the module logger
+
+    @classmethod
+    def from_globals(cls, **overrides) -> "OrganizerConfig":
+        config = cls(
+            source_dirs=(SOURCE_DIR,) if SOURCE_DIR else (),
+            organized_dir="",
+            video_extensions=frozenset(VIDEO_EXTENSIONS),
+            jump_time_threshold=JUMP_TIME_THRESHOLD,
+            preserve_names=PRESERVE_NAMES,
+            dedupe_across_archive=DEDUPE_ACROSS_ARCHIVE,
+            renumber_all=RENUMBER_ALL,
+            verify_transfers=VERIFY_TRANSFERS,
+            container_times_are_utc=CONTAINER_TIMES_ARE_UTC,
+            device_streams=DEVICE_STREAMS,
+            copy_mode=COPY_MODE,
+            thumbnails=THUMBNAILS,
+            scan_subfolders=SCAN_SUBFOLDERS,
+            ingest_workers=INGEST_WORKERS,
+            date_correction_reference=DATE_CORRECTION_REFERENCE,
+            date_correction_reference_clip=DATE_CORRECTION_REFERENCE_CLIP,
+            date_correction_source_references=dict(DATE_CORRECTION_SOURCE_REFERENCES),
+            date_correction_prompt=DATE_CORRECTION_PROMPT,
+            watch_settle_seconds=WATCH_SETTLE_SECONDS,
+            run_report_path=RUN_REPORT_PATH,
+            resume=False,
+            logger=None,
+        )
+        return config._replace(**overrides)
+
+    @property
+    def organized_path(self) -> Path:
+        return Path(self.organized_dir) if self.organized_dir else Path(self.source_dirs[0]) / "organized"
+
+def _config(config: Optional[OrganizerConfig]) -> OrganizerConfig:
+    return config if config is not None else OrganizerConfig.from_globals()
+
+class _Run:
+    """
+    State shared by every thread working on one run: its config, report, event callback and
+    cancellation token. Threads started for a run bind it with _bind_run(), which is how
+    low-level helpers find the report to charge reads to and the logger to use.
+    """
+
+    def __init__(self, config: OrganizerConfig, report: Optional[RunReport] = None,
+                 on_event: Optional[Callable[[dict], None]] = None,
+                 cancel_token: Optional[CancellationToken] = None):
+        self.config = config
+        self.report = report
+        self.on_event = on_event
+        self.cancel_token = cancel_token
+        self.cache = MetadataCache()
+        self.scheduler = IOScheduler(config.device_streams)
+
+_bound = threading.local()  # The run the current thread is working for, if any
+
+def _bind_run(run: Optional[_Run]):
+    _bound.run = run
+
+def _current_run() -> Optional[_Run]:
+    return getattr(_bound, "run", None)
+
+def _active_config() -> OrganizerConfig:
+    """The config of the run the current thread works for, or the constants outside a run."""
+    run = _current_run()
+    return run.config if run is not None else OrganizerConfig.from_globals()
+
+def _metadata_cache() -> Optional[MetadataCache]:
+    run = _current_run()
+    return run.cache if run is not None else None
+
+def _streaming(devices: Dict[int, Path]):
+    """Hold the current run's streaming slots on devices (see IOScheduler), or do nothing outside a run."""
+    run = _current_run()
+    return run.scheduler.streaming(devices) if run is not None else nullcontext(lambda num_bytes: None)
+
+def _record_read(num_bytes: int, files: int = 1):
+    """Charge a file read to the active phase of the current run."""
+    run = _current_run()
+    if run is not None and run.report is not None:
+        run.report.record_read(num_bytes, files)
+
+def _emit(event_type: str, **fields):
+    """
+    Send an event to the current run's callback. Events are dicts with a "type" of
+    "discovered" (files, bytes), "phase" (phase), "file_started" (path, bytes),
+    "bytes" (path, done, total), "file_finished" (path, bytes, status) or "finished" (cancelled).
+    Callbacks may be called from worker threads and should return quickly.
+    """
+    run = _current_run()
+    if run is not None and run.on_event is not None:
+        try:
+            run.on_event({"type": event_type, **fields})
+        except Exception as e:
+            logger.error(f"Error in event callback: {e}")
+
+def _cancelled() -> bool:
+    run = _current_run()
+    return run is not None and run.cancel_token is not None and run.cancel_token.cancelled
+
+def _raise_if_cancelled():
+    run = _current_run()
+    if run is not None and run.cancel_token is not None:
+        run.cancel_token.raise_if_cancelled()
+
+def _sample_offsets(size: int) -> List[int]:
+    """Start offsets of the chunks sampled for a digest signature of a file of the given size."""
+    last_offset = max(size - SIGNATURE_SAMPLE_SIZE, 0)
+    offsets = []
+    for point in SIGNATURE_SAMPLE_POINTS:
+        offset = int(last_offset * min(max(point, 0.0), 1.0))
+        # Small files collapse onto the same chunks; read each one only once
+        if offset not in offsets:
+            offsets.append(offset)
+    return offsets
 
 def get_quick_file_signature(file_path: Path) -> Tuple[int, bytes]:
-    """Get file size and first 1MB of content for quick comparison."""
+    """
+    Get file size and a quick content fingerprint for comparison.
+    In "digest" mode the fingerprint is a BLAKE2b digest over the size and the chunks at
+    SIGNATURE_SAMPLE_POINTS; in "header" mode it is the raw first QUICK_HASH_SIZE bytes.
+    """
     try:
-        size = os.path.getsize(file_path)
         with open(file_path, 'rb') as f:
-            header = f.read(QUICK_HASH_SIZE)
-        return size, header
+            size = os.fstat(f.fileno()).st_size
+            if SIGNATURE_MODE == "header":
+                header = f.read(QUICK_HASH_SIZE)
+                _record_read(len(header))
+                return size, header
+
+            digest = hashlib.blake2b(size.to_bytes(8, 'little'), digest_size=SIGNATURE_DIGEST_SIZE)
+            bytes_read = 0
+            for offset in _sample_offsets(size):
+                f.seek(offset)
+                chunk = f.read(SIGNATURE_SAMPLE_SIZE)
+                bytes_read += len(chunk)
+                digest.update(offset.to_bytes(8, 'little'))
+                digest.update(chunk)
+        _record_read(bytes_read)
+        return size, digest.digest()
     except Exception as e:
         logger.error(f"Error getting file signature for {file_path}: {e}")
         return 0, b''
 
-def get_existing_files(target_dir: Path) -> Dict[Tuple[int, bytes], Path]:
-    """Get a dictionary of existing files and their quick signatures in the target directory."""
-    existing_files = {}
-    if target_dir.exists():
-        for file in target_dir.rglob("*"):
-            if file.is_file():
-                signature = get_quick_file_signature(file)
-                existing_files[signature] = file
-    return existing_files
+def _signature_layout() -> str:
+    """Describe the active signature settings so stored signatures can be invalidated when they change."""
+    if SIGNATURE_MODE == "header":
+        return f"header:{QUICK_HASH_SIZE}"
+    points = ",".join(str(point) for point in SIGNATURE_SAMPLE_POINTS)
+    return f"digest:{SIGNATURE_DIGEST_SIZE}:{SIGNATURE_SAMPLE_SIZE}:{points}"
+
+def _signature_key(signature: Tuple[int, bytes]) -> bytes:
+    """Reduce a quick signature to the compact key stored in the signature index."""
+    if SIGNATURE_MODE == "header":
+        return hashlib.sha256(signature[1]).digest()
+    return signature[1]
+
+def get_full_file_hash(file_path: Path) -> Optional[bytes]:
+    """Stream the whole file through BLAKE2b. Returns None if the file can't be read."""
+    try:
+        digest = hashlib.blake2b()
+        bytes_read = 0
+        with open(file_path, 'rb') as f, _streaming({os.fstat(f.fileno()).st_dev: file_path.parent}) as record:
+            while True:
+                _raise_if_cancelled()
+                chunk = f.read(FULL_HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                bytes_read += len(chunk)
+                digest.update(chunk)
+            record(bytes_read)
+        _record_read(bytes_read)
+        return digest.digest()
+    except OrganizeCancelled:
+        raise
+    except Exception as e:
+        logger.error(f"Error hashing {file_path}: {e}")
+        return None
+
+def _top_folder(rel_path: str) -> str:
+    """Date folder of a path relative to organized/, or '' for files at the top level."""
+    # Files are grouped by their top-level date folder, matching the old rglob scope
+    return rel_path.split('/', 1)[0] if '/' in rel_path else ''
 
-def get_video_date(video_path: Path) -> datetime:
+class SignatureIndex:
     """
-    Get the creation date of a video file.
+    Persistent SQLite index of the files under organized/.
+    Stores size, mtime and inode of every organized file, plus its quick signature and
+    full content hash once they have been needed, so duplicate lookups never re-read the archive.
+    """
+
+    def __init__(self, organized_dir: Path):
+        self.organized_dir = organized_dir
+        index_dir = organized_dir / INDEX_DIR_NAME
+        index_dir.mkdir(parents=True, exist_ok=True)
+        # One connection shared by the ingest workers, serialized through a lock
+        self.conn = sqlite3.connect(str(index_dir / INDEX_DB_NAME), check_same_thread=False)
+        self.lock = threading.RLock()
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        if row is None or row[0] != str(INDEX_SCHEMA_VERSION):
+            self.conn.execute("DROP TABLE IF EXISTS files")
+            self._set_meta('schema', str(INDEX_SCHEMA_VERSION))
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                folder TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                signature BLOB,
+                full_hash BLOB
+            )"""
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS files_by_size ON files (size)")
+        # Source files already imported in copy mode, which stay on the card and are skipped next time
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS imports (
+                source TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                target TEXT NOT NULL,
+                method TEXT NOT NULL
+            )"""
+        )
+
+        # Signatures computed with different settings are not comparable, so forget them
+        layout = _signature_layout()
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'signature_layout'").fetchone()
+        if row is None or row[0] != layout:
+            if row is not None:
+                logger.info("Signature settings changed, discarding stored signatures")
+            self.conn.execute("UPDATE files SET signature = NULL")
+            self._set_meta('signature_layout', layout)
+        self.conn.commit()
+        self.files_read = 0
+
+    def _set_meta(self, key: str, value: str):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def set_jump_threshold(self, threshold: timedelta):
+        """Remember the jump time threshold the whole archive is numbered with (see stored_jump_threshold)."""
+        with self.lock:
+            self._set_meta('jump_threshold_seconds', str(threshold.total_seconds()))
+            self.conn.commit()
+
+    def _relative(self, path: Path) -> str:
+        return path.relative_to(self.organized_dir).as_posix()
+
+    def _iter_files(self):
+        """
+        Yield (relative path, stat) for every organized file, skipping the index itself.
+        The stat results go into the run's metadata cache for the later phases.
+        """
+        cache = _metadata_cache()
+        for root, dirs, files in os.walk(self.organized_dir):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            for name in files:
+                if name.startswith('.'):
+                    continue
+                path = Path(root) / name
+                try:
+                    stat_info = path.stat()
+                except OSError as e:
+                    logger.error(f"Error reading stats for {path}: {e}")
+                    continue
+                if cache is not None:
+                    cache.put(path, stat_info)
+                yield self._relative(path), stat_info
+
+    def refresh(self) -> Set[str]:
+        """
+        Bring the index in line with organized/ using only stat data.
+        Files whose size, mtime or inode changed lose their stored hashes, which are
+        recomputed only if a later lookup needs them. Files that were merely renamed
+        keep their hashes through an inode match. A cancelled run stops it with OrganizeCancelled.
+        Returns the names of the date folders that gained, lost or changed files.
+        """
+        changed_folders = set()
+        with self.lock:
+            known = {}
+            by_inode = {}
+            for path, size, mtime_ns, inode, signature, full_hash in self.conn.execute(
+                    "SELECT path, size, mtime_ns, inode, signature, full_hash FROM files"):
+                known[path] = (size, mtime_ns, inode)
+                by_inode[(inode, size, mtime_ns)] = (path, signature, full_hash)
+
+            seen = set()
+            renamed_from = set()
+            for rel_path, stat_info in self._iter_files():
+                if _cancelled():
+                    # Nothing is committed, so the next refresh finds the same changes
+                    self.conn.rollback()
+                    raise OrganizeCancelled("Organization cancelled")
+                seen.add(rel_path)
+                stat_key = (stat_info.st_size, stat_info.st_mtime_ns, stat_info.st_ino)
+                if known.get(rel_path) == stat_key:
+                    continue
+                old_path, signature, full_hash = by_inode.get(
+                    (stat_info.st_ino, stat_info.st_size, stat_info.st_mtime_ns), (None, None, None)
+                )
+                if old_path is None:
+                    changed_folders.add(_top_folder(rel_path))
+                else:
+                    # A rename inside a folder doesn't change its numbering; a move between folders does
+                    renamed_from.add(old_path)
+                    if _top_folder(old_path) != _top_folder(rel_path):
+                        changed_folders.update((_top_folder(old_path), _top_folder(rel_path)))
+                self._store(rel_path, stat_info, signature, full_hash)
+
+            removed = [(path,) for path in known if path not in seen]
+            changed_folders.update(_top_folder(path) for (path,) in removed if path not in renamed_from)
+            self.conn.executemany("DELETE FROM files WHERE path = ?", removed)
+            self.conn.commit()
+        changed_folders.discard('')
+        logger.debug(f"Signature index refreshed: {len(seen)} files, {len(removed)} removed, "
+                     f"{len(changed_folders)} folders changed")
+        return changed_folders
+
+    def _store(self, rel_path: str, stat_info: os.stat_result, signature: Optional[bytes], full_hash: Optional[bytes]):
+        folder = _top_folder(rel_path)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO files (path, folder, size, mtime_ns, inode, signature, full_hash) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (rel_path, folder, stat_info.st_size, stat_info.st_mtime_ns, stat_info.st_ino, signature, full_hash)
+        )
+
+    def candidates(self, size: int, folder: Optional[Path] = None) -> List[str]:
+        """Relative paths of the organized files with the given size, anywhere in the archive or only in folder."""
+        with self.lock:
+            if folder is None:
+                rows = self.conn.execute("SELECT path FROM files WHERE size = ?", (size,)).fetchall()
+            else:
+                rows = self.conn.execute(
+                    "SELECT path FROM files WHERE size = ? AND folder = ?", (size, self._relative(folder))
+                ).fetchall()
+        return [row[0] for row in rows]
+
+    def signature(self, rel_path: str) -> bytes:
+        """Stored signature key of an organized file, reading the file only if it isn't known yet."""
+        with self.lock:
+            row = self.conn.execute("SELECT signature FROM files WHERE path = ?", (rel_path,)).fetchone()
+        if row and row[0] is not None:
+            return row[0]
+        key = _signature_key(get_quick_file_signature(self.organized_dir / rel_path))
+        with self.lock:
+            self.files_read += 1
+            self.conn.execute("UPDATE files SET signature = ? WHERE path = ?", (key, rel_path))
+            self.conn.commit()
+        return key
+
+    def full_hash(self, rel_path: str) -> Optional[bytes]:
+        """Stored full content hash of an organized file, hashing the file only if it isn't known yet."""
+        with self.lock:
+            row = self.conn.execute("SELECT full_hash FROM files WHERE path = ?", (rel_path,)).fetchone()
+        if row and row[0] is not None:
+            return row[0]
+        full_hash = get_full_file_hash(self.organized_dir / rel_path)
+        with self.lock:
+            self.files_read += 1
+            if full_hash is not None:
+                self.conn.execute("UPDATE files SET full_hash = ? WHERE path = ?", (full_hash, rel_path))
+                self.conn.commit()
+        return full_hash
+
+    def add(self, path: Path, signature: Optional[bytes] = None, full_hash: Optional[bytes] = None) -> os.stat_result:
+        """Record a file that was just placed in organized/, with whatever hashes are already known. Returns its stat."""
+        stat_info = path.stat()
+        with self.lock:
+            self._store(self._relative(path), stat_info, signature, full_hash)
+            self.conn.commit()
+        return stat_info
+
+    def rename(self, old_path: Path, new_path: Path):
+        """Follow a file that was renamed or moved within organized/, keeping its hashes."""
+        rel_path = self._relative(new_path)
+        with self.lock:
+            self.conn.execute("UPDATE files SET path = ?, folder = ? WHERE path = ?",
+                              (rel_path, _top_folder(rel_path), self._relative(old_path)))
+            self.conn.commit()
+
+    def stored_signatures(self, folder: Path) -> Dict[str, bytes]:
+        """Signature keys already stored for the files directly in folder, by file name."""
+        with self.lock:
+            rows = self.conn.execute("SELECT path, signature FROM files WHERE folder = ? AND signature IS NOT NULL",
+                                     (self._relative(folder),)).fetchall()
+        return {path.rsplit('/', 1)[-1]: signature for path, signature in rows}
+
+    def all_signatures(self) -> Set[bytes]:
+        """Every signature key stored in the index, for pruning what is cached under signatures."""
+        with self.lock:
+            return {row[0] for row in self.conn.execute("SELECT DISTINCT signature FROM files WHERE signature IS NOT NULL")}
+
+    def record_import(self, source: Path, stat_info: os.stat_result, target: Path, method: str):
+        """Remember a source file that was copied into (or found already in) organized/ and left in place."""
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO imports (source, size, mtime_ns, target, method) VALUES (?, ?, ?, ?, ?)",
+                (str(source), stat_info.st_size, stat_info.st_mtime_ns, self._relative(target), method)
+            )
+            self.conn.commit()
+
+    def not_imported(self, video_files: List[Tuple[Path, os.stat_result]]) -> List[Tuple[Path, os.stat_result]]:
+        """
+        The (path, stat) pairs that weren't imported before. A file only counts as imported while
+        its size and mtime are unchanged, so a reformatted card reusing the names is imported again.
+        """
+        if not video_files:
+            return video_files
+        with self.lock:
+            imported = {source: (size, mtime_ns) for source, size, mtime_ns in
+                        self.conn.execute("SELECT source, size, mtime_ns FROM imports")}
+        return [(path, stat_info) for path, stat_info in video_files
+                if imported.get(str(path)) != (stat_info.st_size, stat_info.st_mtime_ns)]
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class DuplicateCheck(NamedTuple):
+    """Outcome of a duplicate check, carrying any hashes computed along the way."""
+    duplicate: Optional[Path]
+    signature: Optional[bytes]
+    full_hash: Optional[bytes]
+
+class DuplicateDetector:
+    """
+    Tiered duplicate detection against the signature index.
+    Tier 1 compares sizes only, so files with a unique size are cleared without reading.
+    Tier 2 compares quick signatures of same-size files, and tier 3 compares full
+    content hashes only when quick signatures match, so a skip is never a guess.
+    """
+
+    def __init__(self, index: SignatureIndex):
+        self.index = index
+        self.resolved = {"size": 0, "signature": 0, "full_hash": 0}
+        self._lock = threading.Lock()
+
+    def _resolved_by(self, tier: str):
+        with self._lock:
+            self.resolved[tier] += 1
+
+    def prefetch_signature(self, file_path: Path, folder: Optional[Path] = None,
+                           size: Optional[int] = None) -> Optional[bytes]:
+        """Compute the quick signature ahead of check(), but only if the file's size is already taken."""
+        if size is None:
+            size = os.path.getsize(file_path)
+        if not self.index.candidates(size, folder):
+            return None
+        return _signature_key(get_quick_file_signature(file_path))
+
+    def check(self, file_path: Path, folder: Optional[Path] = None,
+              signature: Optional[bytes] = None, size: Optional[int] = None) -> DuplicateCheck:
+        """
+        Look for an organized file with the same content as file_path, anywhere or only in folder.
+        A signature from prefetch_signature() is reused instead of reading the file again.
+        """
+        if size is None:
+            size = os.path.getsize(file_path)
+        candidates = self.index.candidates(size, folder)
+        if not candidates:
+            self._resolved_by("size")
+            return DuplicateCheck(None, signature, None)
+
+        if signature is None:
+            signature = _signature_key(get_quick_file_signature(file_path))
+        matches = [path for path in candidates if self.index.signature(path) == signature]
+        if not matches:
+            self._resolved_by("signature")
+            return DuplicateCheck(None, signature, None)
+
+        self._resolved_by("full_hash")
+        full_hash = get_full_file_hash(file_path)
+        if full_hash is not None:
+            for path in matches:
+                if self.index.full_hash(path) == full_hash:
+                    return DuplicateCheck(self.index.organized_dir / path, signature, full_hash)
+        return DuplicateCheck(None, signature, full_hash)
+
+    def summary(self) -> str:
+        return (f"Duplicate check: {self.resolved['size']} resolved by size, "
+                f"{self.resolved['signature']} by quick signature, "
+                f"{self.resolved['full_hash']} by full hash")
+
+def _find_atom(data, start: int, end: int, name: bytes, pages: Optional[Set[int]] = None) -> Optional[Tuple[int, int]]:
+    """
+    Find a child atom between start and end. Returns the (payload start, payload end) offsets.
+    The numbers of the pages whose atom headers were read are added to pages, if given.
+    """
+    offset = start
+    while offset + 8 <= end:
+        if pages is not None:
+            pages.add(offset // mmap.PAGESIZE)
+            pages.add((offset + 15) // mmap.PAGESIZE)
+        size, kind = struct.unpack_from('>I4s', data, offset)
+        header_size = 8
+        if size == 1:
+            # 64-bit size follows the type
+            if offset + 16 > end:
+                return None
+            size = struct.unpack_from('>Q', data, offset + 8)[0]
+            header_size = 16
+        elif size == 0:
+            # Atom runs to the end of its parent
+            size = end - offset
+        if size < header_size:
+            return None
+        if kind == name:
+            return offset + header_size, min(offset + size, end)
+        offset += size
+    return None
+
+def read_container_creation_time(video_path: Path, utc: Optional[bool] = None) -> Optional[datetime]:
+    """
+    Read the recording time from the moov/mvhd atom of an MP4/MOV file.
+    The file is memory-mapped and only the atom headers on the way to mvhd are
+    touched, so this costs a few KB of I/O regardless of the file size.
+    With utc set the stored time is converted from UTC to local time; by default the
+    container_times_are_utc setting of the current run (or CONTAINER_TIMES_ARE_UTC) decides.
+    Returns None if the file isn't an MP4/MOV or has no creation time set.
+    """
+    # Only the pages holding the atom headers read on the way are touched, not the whole mapping;
+    # they are counted (in whole pages, as the kernel reads them) for the run report
+    pages = {0}
+    try:
+        with open(video_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                try:
+                    # Don't walk arbitrary bytes as if they were atoms
+                    if len(data) < 8 or data[4:8] not in MP4_TOP_LEVEL_ATOMS:
+                        return None
+                    moov = _find_atom(data, 0, len(data), b'moov', pages)
+                    mvhd = moov and _find_atom(data, moov[0], moov[1], b'mvhd', pages)
+                    if not mvhd:
+                        return None
+                    pages.update(range(mvhd[0] // mmap.PAGESIZE, (mvhd[0] + 12) // mmap.PAGESIZE + 1))
+                    version = data[mvhd[0]]
+                    if version == 1:
+                        seconds = struct.unpack_from('>Q', data, mvhd[0] + 4)[0]
+                    else:
+                        seconds = struct.unpack_from('>I', data, mvhd[0] + 4)[0]
+                finally:
+                    _record_read(min(len(pages) * mmap.PAGESIZE, len(data)))
+    except (OSError, ValueError, struct.error) as e:
+        logger.debug(f"Could not read container date for {video_path}: {e}")
+        return None
+
+    if seconds == 0:
+        return None
+    try:
+        created = MP4_EPOCH + timedelta(seconds=seconds)
+    except OverflowError:
+        return None
+    if utc is None:
+        utc = _active_config().container_times_are_utc
+    if utc:
+        created = created.astimezone()
+    created = created.replace(tzinfo=None)
+    if created.year < 1970 or created > datetime.now() + timedelta(days=1):
+        return None
+    return created
+
+def is_default_clock_date(video_date: datetime) -> bool:
+    """Check if a date looks like a camera clock that was never set (early 2016, the GoPro default)."""
+    return video_date.year == 2016 and video_date.month <= 3
+
+def get_video_date_with_source(video_path: Path, stat_info: Optional[os.stat_result] = None,
+                               config: Optional[OrganizerConfig] = None) -> Tuple[datetime, str]:
+    """
+    Get the creation date of a video file and the name of the source it came from.
     Tries multiple sources in order of reliability:
-    1. File birth time (Finder creation date)
-    2. File modification time
+    1. Recording time stored in the MP4/MOV container ("container")
+    2. File birth time (Finder creation date) ("birth time", or "ctime" where unavailable)
+    3. File modification time ("mtime")
+    A container time that looks like an unset camera clock is skipped, so a corrected
+    file time wins. An already known stat result can be passed in to avoid statting the file again.
     """
+    utc = config.container_times_are_utc if config is not None else None
+    container_date = read_container_creation_time(video_path, utc)
+    if container_date is not None and not is_default_clock_date(container_date):
+        logger.debug(f"File: {video_path.name}")
+        logger.debug(f"  Using container time: {container_date.strftime('%Y-%m-%d %H:%M:%S')}")
+        return container_date, "container"
+
     try:
         # Get file stats
-        stat_info = os.stat(video_path)
+        if stat_info is None:
+            stat_info = os.stat(video_path)
         
         # On macOS, st_birthtime contains the birth time (Finder creation date)
         if hasattr(stat_info, 'st_birthtime'):
             birth_timestamp = stat_info.st_birthtime
-            birth_date = datetime.fromtimestamp(birth_timestamp)
+            birth_source = "birth time"
         else:
             # Fallback to creation time if birth time not available
             birth_timestamp = stat_info.st_ctime
-            birth_date = datetime.fromtimestamp(birth_timestamp)
+            birth_source = "ctime"
+        birth_date = datetime.fromtimestamp(birth_timestamp)
         
         modification_timestamp = stat_info.st_mtime
         modification_date = datetime.fromtimestamp(modification_timestamp)
@@ -77,91 +1025,524 @@ def get_video_date(video_path: Path) -> datetime:
         # Use the earlier of the two times (likely the actual recording time)
         if birth_date < modification_date:
             logger.debug(f"  Using birth time: {birth_date.strftime('%Y-%m-%d %H:%M:%S')}")
-            return birth_date
+            return birth_date, birth_source
         else:
             logger.debug(f"  Using modification time: {modification_date.strftime('%Y-%m-%d %H:%M:%S')}")
-            return modification_date
+            return modification_date, "mtime"
             
     except Exception as e:
         logger.error(f"Error getting date for {video_path}: {e}")
         # Fallback to modification time
         modification_timestamp = os.path.getmtime(video_path)
-        return datetime.fromtimestamp(modification_timestamp)
+        return datetime.fromtimestamp(modification_timestamp), "mtime"
+
+def get_video_date(video_path: Path, stat_info: Optional[os.stat_result] = None,
+                   config: Optional[OrganizerConfig] = None) -> datetime:
+    """Get the creation date of a video file. See get_video_date_with_source() for the sources tried."""
+    return get_video_date_with_source(video_path, stat_info, config)[0]
+
+class VideoRecord:
+    """
+    A video as the archive-wide steps (grouping into jumps, renumbering, clock correction) see it.
+    Slotted, with the folder interned so the records of one directory share a single string, and
+    the recording time kept as seconds since RECORD_EPOCH rather than a datetime, so large numbers
+    of them stay far smaller than (Path, datetime) tuples. path and recorded rebuild those on demand.
+    """
+    __slots__ = ('folder', 'name', 'timestamp', 'size', 'digest')
 
-def group_videos_by_time(video_files: List[Tuple[Path, datetime]]) -> List[List[Tuple[Path, datetime]]]:
+    def __init__(self, folder: str, name: str, timestamp: float, size: int = 0, digest: Optional[bytes] = None):
+        self.folder = sys.intern(folder)
+        self.name = name
+        self.timestamp = timestamp
+        self.size = size
+        self.digest = digest
+
+    @classmethod
+    def from_path(cls, path: Path, recorded: datetime, size: int = 0, digest: Optional[bytes] = None) -> "VideoRecord":
+        path = str(path)
+        return cls(os.path.dirname(path), os.path.basename(path), (recorded - RECORD_EPOCH).total_seconds(), size, digest)
+
+    @property
+    def path(self) -> Path:
+        return Path(self.folder, self.name)
+
+    @property
+    def recorded(self) -> datetime:
+        return RECORD_EPOCH + timedelta(seconds=self.timestamp)
+
+    def __repr__(self) -> str:
+        return f"VideoRecord({os.path.join(self.folder, self.name)!r}, {self.recorded.isoformat()})"
+
+def group_videos_by_time(records: List[VideoRecord], config: Optional[OrganizerConfig] = None) -> List[List[VideoRecord]]:
     """
-    Group videos that were recorded within JUMP_TIME_THRESHOLD of each other.
-    Returns a list of groups, where each group is a list of (path, datetime) tuples.
+    Group videos that were recorded within the jump time threshold of each other.
+    Returns a list of groups, each sorted by recording time.
     """
-    if not video_files:
+    if not records:
         return []
+    threshold = _config(config).jump_time_threshold.total_seconds()
     
     # Sort videos by time
-    sorted_videos = sorted(video_files, key=lambda x: x[1])
+    sorted_records = sorted(records, key=attrgetter('timestamp'))
     groups = []
-    current_group = [sorted_videos[0]]
+    current_group = [sorted_records[0]]
     
-    for video in sorted_videos[1:]:
-        if video[1] - current_group[-1][1] <= JUMP_TIME_THRESHOLD:
-            current_group.append(video)
+    for record in sorted_records[1:]:
+        if record.timestamp - current_group[-1].timestamp <= threshold:
+            current_group.append(record)
         else:
             groups.append(current_group)
-            current_group = [video]
+            current_group = [record]
     
     if current_group:
         groups.append(current_group)
     
     return groups
 
+class PlannedRename(NamedTuple):
+    source: Path
+    target: Path
 
+class PlannedClip(VideoRecord):
+    """
+    A video of a date folder with the place renumbering gives it. Keeps the stat data its
+    manifest entry needs rather than the stat result, so planning a folder holds only records.
+    """
+    __slots__ = ('mtime_ns', 'inode', 'jump', 'video', 'new_name')
 
-def rename_videos_in_directory(directory: Path):
-    """Rename videos in a directory based on their recording times."""
-    # Get all video files in the directory, filtering out invalid files
-    video_files = []
-    for ext in VIDEO_EXTENSIONS:
-        video_files.extend([(f, get_video_date(f)) for f in directory.glob(f"*{ext}") if is_valid_video_file(f)])
-    
-    # Group videos by time
-    video_groups = group_videos_by_time(video_files)
-    
-    # Rename videos in each group
-    for jump_num, group in enumerate(video_groups, 1):
-        # Sort videos within the group by time
-        group.sort(key=lambda x: x[1])
-        
-        for video_num, (video_path, video_time) in enumerate(group, 1):
-            # Create new filename
-            time_str = video_time.strftime("%H-%M")
-            
-            if PRESERVE_NAMES:
-                # Extract original name - if already renamed, get the name from parentheses
-                current_name = video_path.stem  # filename without extension
-                
-                # Check if this is already in our format and extract original name from parentheses
-                if current_name.startswith("Jump ") and " - Video " in current_name and " (" in current_name and current_name.endswith(")"):
-                    # Extract the original name from the parentheses at the end
-                    original_name = current_name.split(" (")[-1].rstrip(")")
-                else:
-                    # This is the first time renaming, use current name as original
-                    original_name = current_name
-                
-                new_name = f"Jump {jump_num} - Video {video_num} - {time_str} ({original_name}){video_path.suffix}"
-            else:
-                # Simple naming without preserving original names
-                new_name = f"Jump {jump_num} - Video {video_num} - {time_str}{video_path.suffix}"
-            
-            new_path = video_path.parent / new_name
-            
+    def __init__(self, folder: str, name: str, timestamp: float, size: int, digest: Optional[bytes],
+                 mtime_ns: int, inode: int):
+        super().__init__(folder, name, timestamp, size, digest)
+        self.mtime_ns = mtime_ns
+        self.inode = inode
+        self.jump = 0
+        self.video = 0
+        self.new_name = name  # Name after renumbering
+
+def _jump_name(video_path: Path, jump_num: int, video_num: int, video_time: datetime, preserve_names: bool) -> str:
+    time_str = video_time.strftime("%H-%M")
+    if not preserve_names:
+        # Simple naming without preserving original names
+        return f"Jump {jump_num} - Video {video_num} - {time_str}{video_path.suffix}"
+
+    # Extract original name - if already renamed, get the name from parentheses
+    current_name = video_path.stem  # filename without extension
+
+    # Check if this is already in our format and extract original name from parentheses
+    if current_name.startswith("Jump ") and " - Video " in current_name and " (" in current_name and current_name.endswith(")"):
+        # Extract the original name from the parentheses at the end
+        original_name = current_name.split(" (")[-1].rstrip(")")
+    else:
+        # This is the first time renaming, use current name as original
+        original_name = current_name
+    return f"Jump {jump_num} - Video {video_num} - {time_str} ({original_name}){video_path.suffix}"
+
+def _original_name(video_path: Path, previous: Optional[dict]) -> str:
+    """The name a clip had on the card, from the folder's previous manifest or its own name."""
+    if previous is not None:
+        return previous["original"]
+    stem = video_path.stem
+    if stem.startswith("Jump ") and " - Video " in stem and " (" in stem and stem.endswith(")"):
+        return stem.split(" (")[-1].rstrip(")") + video_path.suffix
+    return video_path.name
+
+def read_manifest(directory: Path, config: Optional[OrganizerConfig] = None) -> Optional[dict]:
+    """
+    The manifest of a date folder (see write_manifest), or None if it has none or it can't be used,
+    which includes one whose recording times were read with another container_times_are_utc setting.
+    """
+    try:
+        with open(directory / MANIFEST_NAME, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.error(f"Error reading manifest of {directory.name}: {e}")
+        return None
+    if manifest.get("version") != MANIFEST_VERSION or \
+            manifest.get("container_times_are_utc") != _config(config).container_times_are_utc:
+        return None
+    return manifest
+
+def _manifest_clips(manifest: Optional[dict]) -> Dict[str, dict]:
+    return {clip["name"]: clip for clip in manifest["clips"]} if manifest is not None else {}
+
+def _unchanged(clip: Optional[dict], stat_info: os.stat_result) -> bool:
+    return clip is not None and (clip["inode"], clip["size"], clip["mtime_ns"]) == \
+        (stat_info.st_ino, stat_info.st_size, stat_info.st_mtime_ns)
+
+def write_manifest(directory: Path, clips: List[PlannedClip], index: Optional[SignatureIndex] = None,
+                   previous: Optional[dict] = None, config: Optional[OrganizerConfig] = None):
+    """
+    Write directory/.manifest.json listing every clip once the folder is renumbered: its name,
+    original name, recording time and where that came from, jump and video number, size and
+    quick signature. Signatures the index doesn't have yet (files that never collided on size)
+    are computed and stored there, so each clip is read once. The file is replaced atomically, so
+    readers see either the old or the new manifest; stat data in it lets the next run trust unchanged entries.
+    """
+    cache = _metadata_cache()
+    previous_clips = {clip["inode"]: clip for clip in previous["clips"]} if previous is not None else {}
+    digests = index.stored_signatures(directory) if index is not None else {}
+    entries = []
+    for clip in clips:
+        earlier = previous_clips.get(clip.inode)
+        # The cache follows renames, so by now the clip is under its new name
+        source = cache.date_source(directory / clip.new_name) if cache is not None else None
+        if source is None:
+            source = earlier["time_source"] if earlier is not None else None
+        digest = digests.get(clip.new_name, clip.digest)
+        if digest is None and index is not None:
+            digest = index.signature(f"{directory.name}/{clip.new_name}")
+        entries.append({
+            "name": clip.new_name,
+            "original": _original_name(clip.path, earlier),
+            "recorded": clip.recorded.isoformat(),
+            "time_source": source,
+            "jump": clip.jump,
+            "video": clip.video,
+            "size": clip.size,
+            "mtime_ns": clip.mtime_ns,
+            "inode": clip.inode,
+            "digest": digest.hex() if digest is not None else None,
+        })
+    manifest = {"version": MANIFEST_VERSION, "container_times_are_utc": _config(config).container_times_are_utc,
+                "folder": directory.name, "clips": entries}
+    temp = directory / f"{MANIFEST_NAME}{PARTIAL_SUFFIX}"
+    try:
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, directory / MANIFEST_NAME)
+    except OSError as e:
+        logger.error(f"Error writing manifest of {directory.name}: {e}")
+        temp.unlink(missing_ok=True)
+
+def manifest_folders(organized_dir: Path) -> List[Path]:
+    """The date folders of organized/, newest first, from one directory listing and without statting them."""
+    try:
+        with os.scandir(organized_dir) as entries:
+            folders = [Path(entry.path) for entry in entries
+                       if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.')]
+    except OSError as e:
+        logger.error(f"Error scanning {organized_dir}: {e}")
+        return []
+    return sorted(folders, key=lambda folder: folder.name, reverse=True)
+
+def plan_folder(directory: Path, config: Optional[OrganizerConfig] = None,
+                manifest: Optional[dict] = None) -> List[PlannedClip]:
+    """
+    Work out the place of every video in a directory, from a single listing.
+    Videos are grouped into jumps by recording time. Recording times of files unchanged since
+    the folder's manifest was written are taken from it (digest included) instead of being read
+    from the files. Returns the clips in jump order, each placed in the record itself.
+    """
+    config = _config(config)
+    cache = _metadata_cache()
+    known = _manifest_clips(manifest)
+    folder = str(directory)
+    clips = []
+    for f, stat_info in find_video_files(directory, config=config, cached=True):
+        entry = known.get(f.name)
+        unchanged = _unchanged(entry, stat_info)
+        if cache is not None and unchanged:
+            cache.put(f, stat_info)
+            cache.set_date(f, datetime.fromisoformat(entry["recorded"]), entry["time_source"])
+        video_date = cache.video_date(f, stat_info) if cache is not None else get_video_date(f, stat_info, config)
+        digest = bytes.fromhex(entry["digest"]) if unchanged and entry["digest"] else None
+        clips.append(PlannedClip(folder, f.name, (video_date - RECORD_EPOCH).total_seconds(), stat_info.st_size,
+                                 digest, stat_info.st_mtime_ns, stat_info.st_ino))
+
+    planned = []
+    for jump_num, group in enumerate(group_videos_by_time(clips, config), 1):
+        for video_num, clip in enumerate(group, 1):
+            clip.jump, clip.video = jump_num, video_num
+            clip.new_name = _jump_name(clip.path, jump_num, video_num, clip.recorded, config.preserve_names)
+            planned.append(clip)
+    return planned
+
+def plan_renames(directory: Path, config: Optional[OrganizerConfig] = None) -> List[PlannedRename]:
+    """
+    The renames renumbering a directory takes: only files whose name changes are returned.
+    Since every file gets a distinct name, the plan can always be applied in full by apply_renames().
+    """
+    return [PlannedRename(clip.path, clip.path.with_name(clip.new_name))
+            for clip in plan_folder(directory, config, read_manifest(directory, config)) if clip.new_name != clip.name]
+
+def _temp_name(path: Path) -> Path:
+    return path.with_name(f".{path.name}{RENAME_SUFFIX}")
+
+def _rename_no_clobber(source: Path, target: Path) -> bool:
+    """
+    Rename source to target unless target exists. A hardlink makes the check atomic where the
+    filesystem has them; elsewhere (FAT, exFAT) it is an exists() check. Returns whether it moved.
+    """
+    try:
+        os.link(source, target)
+    except FileExistsError:
+        return False
+    except OSError:
+        if target.exists():
+            return False
+        os.rename(source, target)
+        return True
+    os.unlink(source)
+    return True
+
+def apply_renames(plan: List[PlannedRename], index: Optional[SignatureIndex] = None,
+                  journal: Optional["MoveJournal"] = None) -> int:
+    """
+    Apply a rename plan in two phases: every file first moves to a hidden temporary name, then
+    to its new name. Any permutation of names (such as jump numbers shifting after a new clip was
+    inserted) therefore succeeds in 2N renames without collisions or exists() checks.
+    If the first phase fails the files are moved back, so a folder is never left half-renumbered.
+    A file the second phase can't rename goes back to its old name once the plan is done, if no entry
+    of the plan targets that name and it is free; otherwise it stays under its temporary name. Either
+    way the journal entry is left open, so recovery moves leftover temporary names on.
+    Returns the number of files renamed.
+    """
+    if not plan:
+        return 0
+    entry_id = journal.start_renumber(plan) if journal is not None else None
+
+    moved = []
+    try:
+        for rename in plan:
+            os.rename(rename.source, _temp_name(rename.source))
+            moved.append(rename)
+    except OSError as e:
+        logger.error(f"Error renaming {rename.source.name}: {e} - leaving {rename.source.parent.name} as it was")
+        for rename in reversed(moved):
             try:
-                if new_path.exists():
-                    logger.debug(f"Target file already exists: {new_path}")
-                    continue
-                    
-                video_path.rename(new_path)
-                logger.info(f"Renamed {video_path.name} to {new_name}")
-            except Exception as e:
-                logger.error(f"Error renaming {video_path.name}: {e}")
+                os.rename(_temp_name(rename.source), rename.source)
+            except OSError as e:
+                logger.error(f"Error restoring {rename.source.name}: {e}")
+        if entry_id is not None:
+            journal.finish(entry_id, "rolled_back")
+        return 0
+
+    if entry_id is not None:
+        journal.finish(entry_id, "applying")
+    cache = _metadata_cache()
+    renamed = 0
+    failed = []
+    for rename in plan:
+        try:
+            os.rename(_temp_name(rename.source), rename.target)
+        except OSError as e:
+            logger.error(f"Error renaming {rename.source.name}: {e}")
+            failed.append(rename)
+            continue
+        if index is not None:
+            index.rename(rename.source, rename.target)
+        if cache is not None:
+            cache.move(rename.source, rename.target)
+        logger.info(f"Renamed {rename.source.name} to {rename.target.name}")
+        renamed += 1
+
+    # Hidden files are skipped by discovery and the index, so failed files go back to their old
+    # names where that can't overwrite another file of the plan
+    targets = {rename.target for rename in plan}
+    for rename in failed:
+        try:
+            if rename.source in targets or not _rename_no_clobber(_temp_name(rename.source), rename.source):
+                logger.error(f"Left {rename.source.name} as {_temp_name(rename.source).name} - the next run moves it on")
+        except OSError as e:
+            logger.error(f"Error restoring {rename.source.name}: {e} - the next run moves it on")
+    if entry_id is not None and not failed:
+        # On failure the entry stays "applying": recovery finishes any temporary names and renumbers again
+        journal.finish(entry_id)
+    return renamed
+
+def rename_videos_in_directory(directory: Path, index: Optional[SignatureIndex] = None,
+                               config: Optional[OrganizerConfig] = None, journal: Optional["MoveJournal"] = None):
+    """
+    Rename videos in a directory based on their recording times, then rewrite its manifest.
+    If a signature index is given, renamed files are updated in it as well.
+    """
+    manifest = read_manifest(directory, config)
+    clips = plan_folder(directory, config, manifest)
+    plan = [PlannedRename(clip.path, clip.path.with_name(clip.new_name)) for clip in clips if clip.new_name != clip.name]
+    if apply_renames(plan, index, journal) == len(plan):
+        write_manifest(directory, clips, index, manifest, config)
+    else:
+        # Some names are not what the plan says; the next run renumbers the folder again
+        (directory / MANIFEST_NAME).unlink(missing_ok=True)
+
+def plan_archive_renames(config: Optional[OrganizerConfig] = None) -> Dict[str, List[dict]]:
+    """The renames renumbering every date folder would make, as JSON-ready {folder: [{"from", "to"}]}, changing nothing."""
+    organized_dir = _config(config).organized_path
+    plans = {}
+    if organized_dir.is_dir():
+        for date_dir in sorted(d for d in organized_dir.iterdir() if d.is_dir() and not d.name.startswith('.')):
+            plan = plan_renames(date_dir, config)
+            if plan:
+                plans[date_dir.name] = [{"from": rename.source.name, "to": rename.target.name} for rename in plan]
+    return plans
+
+class ArchiveTimeline(NamedTuple):
+    """
+    Recording times of every clip in organized/ as NumPy arrays, sorted by date folder and then
+    time, with the jump number each clip currently has (0 where the folder has no manifest).
+    """
+    folders: List[str]  # Date folder names; folder_ids index into this list
+    folder_ids: "numpy.ndarray"
+    timestamps: "numpy.ndarray"  # Seconds since RECORD_EPOCH
+    jumps: "numpy.ndarray"
+
+def load_archive_timeline(config: Optional[OrganizerConfig] = None) -> ArchiveTimeline:
+    """
+    Collect the recording times of the whole archive from the date folders' manifests. Folders
+    without one are planned from their files instead, and count as changed by any threshold.
+    """
+    import numpy
+
+    config = _config(config)
+    folders, folder_ids, timestamps, jumps = [], [], [], []
+    for date_dir in sorted(manifest_folders(config.organized_path)):
+        manifest = read_manifest(date_dir, config)
+        count = len(timestamps)
+        if manifest is not None:
+            for clip in manifest["clips"]:
+                timestamps.append((datetime.fromisoformat(clip["recorded"]) - RECORD_EPOCH).total_seconds())
+                jumps.append(clip["jump"])
+        else:
+            for clip in plan_folder(date_dir, config):
+                timestamps.append(clip.timestamp)
+                jumps.append(0)
+        if len(timestamps) == count:
+            continue
+        folder_ids.extend([len(folders)] * (len(timestamps) - count))
+        folders.append(date_dir.name)
+
+    folder_ids = numpy.array(folder_ids, dtype=numpy.int32)
+    timestamps = numpy.array(timestamps, dtype=numpy.float64)
+    jumps = numpy.array(jumps, dtype=numpy.int32)
+    order = numpy.lexsort((timestamps, folder_ids))
+    return ArchiveTimeline(folders, folder_ids[order], timestamps[order], jumps[order])
+
+def _jump_starts(timeline: ArchiveTimeline, threshold: timedelta) -> "numpy.ndarray":
+    """Per clip, whether it starts a jump: it is the first of its folder or follows a gap over threshold."""
+    import numpy
+
+    starts = numpy.ones(len(timeline.timestamps), dtype=bool)
+    starts[1:] = (timeline.folder_ids[1:] != timeline.folder_ids[:-1]) | \
+        (numpy.diff(timeline.timestamps) > threshold.total_seconds())
+    return starts
+
+def _jump_numbers(timeline: ArchiveTimeline, starts: "numpy.ndarray") -> "numpy.ndarray":
+    """Jump number of every clip within its folder, from the jump starts."""
+    import numpy
+
+    jump_ids = numpy.cumsum(starts)
+    folder_starts = numpy.flatnonzero(timeline.folder_ids[1:] != timeline.folder_ids[:-1]) + 1
+    first_jump = jump_ids[numpy.concatenate(([0], folder_starts))]
+    return jump_ids - first_jump[timeline.folder_ids] + 1
+
+def changed_folders(timeline: ArchiveTimeline, threshold: timedelta) -> List[str]:
+    """Date folders in which some clip would get a different jump number with threshold."""
+    import numpy
+
+    if not len(timeline.timestamps):
+        return []
+    numbers = _jump_numbers(timeline, _jump_starts(timeline, threshold))
+    return [timeline.folders[i] for i in numpy.unique(timeline.folder_ids[numbers != timeline.jumps])]
+
+def preview_thresholds(timeline: ArchiveTimeline, thresholds: List[timedelta]) -> Dict[str, dict]:
+    """
+    What each jump time threshold would do to the archive, keyed by threshold in minutes:
+    total jumps, jumps per date folder and the number of folders whose numbering would change.
+    The gaps between clips are sorted per folder once; after that each threshold is one binary
+    search per folder, so sweeping many thresholds over years of footage takes milliseconds.
+    """
+    import numpy
+
+    folder_count = len(timeline.folders)
+    folder_range = numpy.arange(folder_count)
+    same_folder = timeline.folder_ids[1:] == timeline.folder_ids[:-1]
+    gaps = numpy.diff(timeline.timestamps)[same_folder]
+    gap_folders = timeline.folder_ids[1:][same_folder]
+
+    # A folder keeps its numbering exactly while the threshold is at least its largest gap inside
+    # a current jump and below its smallest gap between two current jumps
+    boundary = (timeline.jumps[1:] != timeline.jumps[:-1])[same_folder]
+    keeps_from = numpy.full(folder_count, -numpy.inf)
+    numpy.maximum.at(keeps_from, gap_folders[~boundary], gaps[~boundary])
+    keeps_until = numpy.full(folder_count, numpy.inf)
+    numpy.minimum.at(keeps_until, gap_folders[boundary], gaps[boundary])
+    unnumbered = numpy.zeros(folder_count, dtype=bool)
+    unnumbered[timeline.folder_ids[timeline.jumps == 0]] = True
+
+    # Gaps sorted by folder and then size, as one increasing key so a single searchsorted finds,
+    # for every folder at once, how many of its gaps are within the threshold
+    order = numpy.lexsort((gaps, gap_folders))
+    span = (gaps.max() if len(gaps) else 0.0) + 1.0
+    keys = gap_folders[order] * span + gaps[order]
+    folder_ends = numpy.searchsorted(gap_folders[order], folder_range, side='right')
+
+    preview = {}
+    for threshold in thresholds:
+        seconds = threshold.total_seconds()
+        within = numpy.searchsorted(keys, folder_range * span + min(seconds, span - 1.0), side='right')
+        counts = folder_ends - within + 1
+        changed = unnumbered | (seconds < keeps_from) | (seconds >= keeps_until)
+        preview[f"{seconds / 60:g}"] = {"jumps": int(counts.sum()), "changed_folders": int(changed.sum()),
+                                        "folders": dict(zip(timeline.folders, counts.tolist()))}
+    return preview
+
+def regroup_archive(threshold: timedelta, config: Optional[OrganizerConfig] = None) -> List[str]:
+    """
+    Renumber the archive for a new jump time threshold, touching only the date folders whose
+    numbering changes (and any that changed outside of this tool). The threshold is stored in the
+    index, so later runs that aren't given one keep numbering with it. Returns the folder names.
+    """
+    config = _config(config)._replace(jump_time_threshold=threshold)
+    organized_dir = config.organized_path
+    if not organized_dir.is_dir():
+        logger.error(f"Organized folder {organized_dir} does not exist!")
+        return []
+    previous = _current_run()
+    _bind_run(_Run(config))
+    journal = index = None
+    try:
+        journal = MoveJournal(organized_dir)
+        dirty = journal.recover()
+        index = SignatureIndex(organized_dir)
+        dirty |= index.refresh()
+        timeline = load_archive_timeline(config)
+        changed = sorted(set(changed_folders(timeline, threshold)) | dirty)
+        for name in changed:
+            if (organized_dir / name).is_dir():
+                rename_videos_in_directory(organized_dir / name, index, config, journal)
+        index.set_jump_threshold(threshold)
+        logger.info(f"Regrouped with a {threshold} threshold: {len(changed)} of {len(timeline.folders)} "
+                    f"date folders changed")
+        return changed
+    finally:
+        if index is not None:
+            index.close()
+        if journal is not None:
+            journal.close()
+        _bind_run(previous)
+
+def stored_jump_threshold(organized_dir: Path) -> Optional[timedelta]:
+    """
+    The jump time threshold regroup_archive() last numbered the archive with, or None if it never ran.
+    Read without creating the index, so looking at a folder that isn't an archive changes nothing.
+    """
+    db_path = organized_dir / INDEX_DIR_NAME / INDEX_DB_NAME
+    if not db_path.is_file():
+        return None
+    try:
+        conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'jump_threshold_seconds'").fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.error(f"Error reading the jump time threshold from {db_path}: {e}")
+        return None
+    return timedelta(seconds=float(row[0])) if row is not None else None
 
 def is_in_dated_folder(path: Path) -> bool:
     """
@@ -175,39 +1556,65 @@ def is_in_dated_folder(path: Path) -> bool:
     except ValueError:
         return False
 
-def check_and_fix_video_date(video_path: Path) -> datetime:
+def correct_default_clock_dates(video_dates: Dict[Path, datetime], reference_time: Optional[datetime] = None,
+                                reference_clip: Optional[Path] = None, prompt: bool = False,
+                                config: Optional[OrganizerConfig] = None, write_times: bool = True) -> List[Path]:
     """
-    Check if video date is potentially incorrect (early 2016) and allow manual correction.
-    Returns the corrected or original date.
+    Correct the dates of clips recorded with an unset camera clock (see is_default_clock_date) in one batch.
+    The clips are grouped into jumps and all of them get a single clock offset, which anchors the
+    earliest clip either at reference_time or at the recording time of reference_clip, a clip with a
+    trustworthy time recorded at the same moment. With prompt set and neither given, the reference time
+    is asked for once on the command line.
+    Corrected dates are updated in video_dates and, with write_times set, written to the files with
+    os.utime in one pass (copy mode leaves the card untouched and retimes the copies instead).
+    Returns the clips that could not be corrected.
     """
-    video_date = get_video_date(video_path)
-    
-    # Check if date is from early 2016 (GoPro default)
-    if video_date.year == 2016 and video_date.month <= 3:
-        print(f"\nPotentially incorrect date detected for {video_path.name}")
-        print(f"Current date: {video_date.strftime('%Y-%m-%d %H:%M:%S')}")
-        
+    suspects = [(path, date) for path, date in video_dates.items() if is_default_clock_date(date)]
+    if not suspects:
+        return []
+    jumps = group_videos_by_time([VideoRecord.from_path(path, date) for path, date in suspects], config)
+    earliest_path, earliest_date = jumps[0][0].path, jumps[0][0].recorded
+    logger.info(f"{len(suspects)} clips in {len(jumps)} jumps have an unset camera clock, "
+                f"starting with {earliest_path.name} at {earliest_date.strftime('%Y-%m-%d %H:%M:%S')}")
+
+    if reference_time is None and reference_clip is not None:
+        clip_date, source = get_video_date_with_source(reference_clip, config=config)
+        if is_default_clock_date(clip_date):
+            logger.error(f"Reference clip {reference_clip.name} has an unset camera clock too")
+        else:
+            logger.info(f"Using {reference_clip.name} ({source}) as the reference time")
+            reference_time = clip_date
+    if reference_time is None and prompt:
         while True:
+            answer = input(f"Enter the real recording time of {earliest_path} "
+                           f"(YYYY-MM-DD HH:MM:SS), or leave empty to skip these clips: ").strip()
+            if not answer:
+                break
             try:
-                date_str = input("Please enter the correct date (YYYY-MM-DD): ")
-                time_str = input("Please enter the correct time (HH:MM:SS): ")
-                
-                # Combine date and time
-                datetime_str = f"{date_str} {time_str}"
-                corrected_date = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-                
-                # Update file timestamps
-                timestamp = corrected_date.timestamp()
-                os.utime(video_path, (timestamp, timestamp))
-                
-                print(f"Updated date for {video_path.name} to {corrected_date}")
-                return corrected_date
-                
+                reference_time = datetime.strptime(answer, "%Y-%m-%d %H:%M:%S")
+                break
             except ValueError:
-                print("Invalid date/time format. Please use YYYY-MM-DD and HH:MM:SS format.")
-                continue
-    
-    return video_date
+                print("Invalid date/time format. Please use YYYY-MM-DD HH:MM:SS format.")
+    if reference_time is None:
+        logger.warning(f"Leaving {len(suspects)} clips with an unset camera clock in place; "
+                       f"set a reference time to organize them")
+        return [path for path, _ in suspects]
+
+    # One offset for the whole card keeps the spacing between clips and jumps intact
+    offset = reference_time - earliest_date
+    uncorrected = []
+    for path, date in suspects:
+        corrected_date = date + offset
+        timestamp = corrected_date.timestamp()
+        try:
+            if write_times:
+                os.utime(path, (timestamp, timestamp))
+            video_dates[path] = corrected_date
+        except OSError as e:
+            logger.error(f"Error updating date for {path.name}: {e}")
+            uncorrected.append(path)
+    logger.info(f"Shifted {len(suspects) - len(uncorrected)} clips by {offset}")
+    return uncorrected
 
 def is_valid_video_file(file_path: Path) -> bool:
     """
@@ -222,74 +1629,1378 @@ def is_valid_video_file(file_path: Path) -> bool:
         return False
     return True
 
-def organize_videos():
-    """Main function to organize videos by date."""
-    if not SOURCE_DIR:
-        logger.error("Source directory not set! Please set SOURCE_DIR or use the GUI.")
-        return
-        
-    source_path = Path(SOURCE_DIR)
-    if not source_path.exists():
-        logger.error(f"Source directory {SOURCE_DIR} does not exist!")
-        return
+class TransferResult(NamedTuple):
+    """How a file was moved into organized/."""
+    bytes_copied: int  # 0 when the file was renamed in place, reflinked or hardlinked
+    seconds: float
+    method: str  # "rename", "reflink", "hardlink", "copy_file_range", "sendfile" or "copy"
+    verified: bool
 
-    # Get all video files in top-level directory only
-    video_files = []
-    for ext in VIDEO_EXTENSIONS:
-        video_files.extend([f for f in source_path.glob(f"*{ext}") if is_valid_video_file(f)])
+def _copy_with_kernel(src, dst, size: int, progress: Optional[Callable[[int, int], None]]) -> Tuple[int, str]:
+    """
+    Copy between two open files without passing the data through Python where the OS allows it.
+    Tries copy_file_range, then sendfile, then a plain buffered copy. Returns (bytes copied, method).
+    """
+    src_fd, dst_fd = src.fileno(), dst.fileno()
+    copied = 0
+    for method in ("copy_file_range", "sendfile"):
+        copy_call = getattr(os, method, None)
+        if copy_call is None:
+            continue
+        try:
+            while copied < size:
+                if method == "copy_file_range":
+                    sent = copy_call(src_fd, dst_fd, TRANSFER_CHUNK_SIZE)
+                else:
+                    sent = copy_call(dst_fd, src_fd, copied, TRANSFER_CHUNK_SIZE)
+                if sent == 0:
+                    break
+                copied += sent
+                if progress:
+                    progress(copied, size)
+            return copied, method
+        except OSError as e:
+            # Unsupported for this pair of files; only fall back if nothing was written yet
+            if copied or e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+                                         errno.ENOTSOCK, errno.EBADF):
+                raise
 
-    if not video_files:
-        logger.info("No video files found in the source directory.")
-        return
+    copied, _ = _copy_buffered(src, dst, size, progress)
+    return copied, "copy"
 
-    # Process each video file
-    for video_path in video_files:
+def _copy_buffered(src, dst, size: int, progress: Optional[Callable[[int, int], None]],
+                   digest=None) -> Tuple[int, Optional[bytes]]:
+    """Copy through a reusable buffer, optionally hashing the data on the way. Returns (bytes copied, digest)."""
+    buffer = bytearray(TRANSFER_CHUNK_SIZE)
+    view = memoryview(buffer)
+    copied = 0
+    while True:
+        read = src.readinto(buffer)
+        if not read:
+            break
+        dst.write(view[:read])
+        if digest is not None:
+            digest.update(view[:read])
+        copied += read
+        if progress:
+            progress(copied, size)
+    return copied, digest.digest() if digest is not None else None
+
+def _clone_file(source: Path, target: Path) -> bool:
+    """
+    Create target as a copy-on-write clone of source, sharing its data blocks, where the
+    filesystem supports it (FICLONE on Linux, clonefile() on macOS). Returns False otherwise.
+    """
+    if sys.platform == 'darwin':
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        clonefile = getattr(libc, 'clonefile', None)
+        # clonefile() keeps the timestamps itself
+        return clonefile is not None and clonefile(os.fsencode(source), os.fsencode(target), 0) == 0
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(source, 'rb') as src, open(target, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    except OSError:
+        # Not supported here, or source and target are on different filesystems
+        target.unlink(missing_ok=True)
+        return False
+    shutil.copystat(source, target)
+    return True
+
+def transfer_file(source: Path, target: Path, verify: Optional[bool] = None,
+                  progress: Optional[Callable[[int, int], None]] = None,
+                  source_stat: Optional[os.stat_result] = None, target_dev: Optional[int] = None,
+                  keep_source: bool = False, hardlink: bool = True) -> TransferResult:
+    """
+    Move a file to target, whose parent directory must exist.
+    On the same device the file is simply renamed. With keep_source set the source is left
+    in place instead: target is made a reflink (copy-on-write clone) of it where the filesystem
+    supports that, else a hardlink on the same filesystem (unless hardlink is unset, for a target
+    whose times will be changed), and only otherwise a copy. Across devices the data is copied
+    with copy_file_range/sendfile where available, written under a hidden partial name
+    and renamed into place only once complete, so an interrupted copy never looks like
+    an organized file. With verify set (by default as the run's config says), the source is
+    hashed while copying and the copy is read back and compared before the source is deleted.
+    progress is called with (bytes copied, total bytes) as the copy advances.
+    source_stat and target_dev (the device of target's folder) save the stat calls when known.
+    """
+    if verify is None:
+        verify = _active_config().verify_transfers
+    start = time.monotonic()
+    source_dev = (source_stat or os.stat(source)).st_dev
+    if target_dev is None:
+        target_dev = os.stat(target.parent).st_dev
+    partial = target.with_name(f".{target.name}{PARTIAL_SUFFIX}")
+    devices = {source_dev: source.parent, target_dev: target.parent}
+    run = _current_run()
+    if keep_source:
+        # Cloning fails fast across filesystems, and subvolumes of one btrfs filesystem differ in
+        # st_dev but can still share blocks, so it is always tried
+        if _clone_file(source, partial):
+            os.replace(partial, target)
+            if run is not None:
+                run.scheduler.metadata(devices)
+            return TransferResult(0, time.monotonic() - start, "reflink", False)
+        if hardlink and source_dev == target_dev:
+            try:
+                os.link(source, target)
+                if run is not None:
+                    run.scheduler.metadata(devices)
+                return TransferResult(0, time.monotonic() - start, "hardlink", False)
+            except OSError as e:
+                # e.g. a filesystem without hardlinks (FAT, exFAT) or a mount point in between
+                logger.debug(f"Cannot hardlink {source.name}: {e}")
+    elif source_dev == target_dev:
+        try:
+            os.rename(source, target)
+            if run is not None:
+                run.scheduler.metadata(devices)
+            return TransferResult(0, time.monotonic() - start, "rename", False)
+        except OSError as e:
+            # The target folder may be a mount point of its own
+            if e.errno != errno.EXDEV:
+                raise
+
+    try:
+        # Renames and links above never wait; a copy queues for a slot on both drives
+        with _streaming(devices) as record, open(source, 'rb') as src, open(partial, 'wb') as dst:
+            source_stat = os.fstat(src.fileno())
+            if verify:
+                copied, source_hash = _copy_buffered(src, dst, source_stat.st_size, progress, hashlib.blake2b())
+                method = "copy"
+            else:
+                copied, method = _copy_with_kernel(src, dst, source_stat.st_size, progress)
+            dst.flush()
+            os.fsync(dst.fileno())
+            record(copied)
+            if copied != source_stat.st_size:
+                raise OSError(f"Copied {copied} of {source_stat.st_size} bytes")
+            if verify and get_full_file_hash(partial) != source_hash:
+                raise OSError("Copy does not match the source")
+        # Keep the timestamps the recording date was read from
+        shutil.copystat(source, partial)
+        os.replace(partial, target)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+    if not keep_source:
+        os.unlink(source)
+    return TransferResult(copied, time.monotonic() - start, method, verify)
+
+class MoveJournal:
+    """
+    Write-ahead journal of the moves and renumbering done in organized/, kept in organized/.index/.
+    Moves are logged as planned once their dates are known, as started just before the file is
+    transferred and as finished once it is in place or left behind; renumbering a folder is logged
+    as started and finished. Each line reaches the disk before the step it announces, so after a
+    crash recover() can complete or roll back exactly the steps that were interrupted.
+    """
+
+    def __init__(self, organized_dir: Path):
+        self.organized_dir = organized_dir
+        self.path = organized_dir / INDEX_DIR_NAME / JOURNAL_NAME
+        self.lock = threading.Lock()
+        self.file = None
+        self.entries = {}  # id -> latest state of each unfinished entry
+        self.planned = {}  # source path -> id of its move entry
+        self.next_id = 1
         try:
-            # Skip if already in a dated folder
-            if is_in_dated_folder(video_path):
-                logger.info(f"Skipping {video_path.name} - already in a dated folder")
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # The last line may have been cut short by the crash itself
+                        continue
+                    self.entries.setdefault(record["id"], {}).update(record)
+                    self.next_id = max(self.next_id, record["id"] + 1)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Error reading journal {self.path}: {e}")
+        self.entries = {entry_id: entry for entry_id, entry in self.entries.items()
+                        if entry["state"] not in JOURNAL_FINISHED_STATES}
+        self.planned = {entry["source"]: entry_id for entry_id, entry in self.entries.items() if entry["op"] == "move"}
+
+    def _write(self, records: List[dict]):
+        with self.lock:
+            for record in records:
+                entry = self.entries.setdefault(record["id"], {})
+                entry.update(record)
+                if entry["state"] in JOURNAL_FINISHED_STATES:
+                    del self.entries[record["id"]]
+            if self.file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self.file = open(self.path, 'a', encoding='utf-8')
+            self.file.write("".join(json.dumps(record) + "\n" for record in records))
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+    def _new_ids(self, count: int) -> range:
+        with self.lock:
+            ids = range(self.next_id, self.next_id + count)
+            self.next_id += count
+        return ids
+
+    def plan_moves(self, items: List[Tuple[Path, os.stat_result, datetime, Path]]):
+        """Log (path, stat, recording date, source directory) of files about to be ingested, in one write."""
+        items = [item for item in items if str(item[0]) not in self.planned]
+        records = []
+        for entry_id, (path, stat_info, video_date, root) in zip(self._new_ids(len(items)), items):
+            records.append({"id": entry_id, "op": "move", "state": "planned", "source": str(path), "root": str(root),
+                            "size": stat_info.st_size, "mtime_ns": stat_info.st_mtime_ns,
+                            "date": video_date.isoformat()})
+        if records:
+            self._write(records)
+            with self.lock:
+                self.planned.update((record["source"], record["id"]) for record in records)
+
+    def start_move(self, source: Path, target: Path, keep_source: bool = False):
+        entry_id = self.planned.get(str(source))
+        if entry_id is not None:
+            self._write([{"id": entry_id, "state": "started", "target": str(target.relative_to(self.organized_dir)),
+                          "keep_source": keep_source}])
+
+    def finish_move(self, source: Path, state: str = "done"):
+        with self.lock:
+            entry_id = self.planned.pop(str(source), None)
+        if entry_id is not None:
+            self._write([{"id": entry_id, "state": state}])
+
+    def restore_move(self, source: Path):
+        """Mark a move that failed or was cancelled before the file was placed as planned again."""
+        entry_id = self.planned.get(str(source))
+        if entry_id is not None:
+            self._write([{"id": entry_id, "state": "planned"}])
+
+    def start_renumber(self, plan: List["PlannedRename"]) -> int:
+        """Log a folder's rename plan before its files move to their temporary names."""
+        entry_id = self._new_ids(1)[0]
+        self._write([{"id": entry_id, "op": "renumber", "state": "started",
+                      "folder": str(plan[0].source.parent.relative_to(self.organized_dir)),
+                      "renames": [[rename.source.name, rename.target.name] for rename in plan]}])
+        return entry_id
+
+    def finish(self, entry_id: int, state: str = "done"):
+        self._write([{"id": entry_id, "state": state}])
+
+    def planned_moves(self) -> List[dict]:
+        """Moves that were planned but never started, oldest first."""
+        with self.lock:
+            return [dict(entry) for _, entry in sorted(self.entries.items())
+                    if entry["op"] == "move" and entry["state"] == "planned"]
+
+    def recover(self) -> Set[str]:
+        """
+        Complete or roll back the moves and renumbering that were in progress when a run died.
+        A copied target counts as complete only if its size and quick signature match the source
+        (or the source is already gone, which only happens after the copy was renamed into place);
+        otherwise the partial file is removed and the source stays where it is.
+        Returns the date folders that need renumbering.
+        """
+        dirty_folders = set()
+        with self.lock:
+            interrupted = [dict(entry) for _, entry in sorted(self.entries.items())
+                           if entry["state"] in ("started", "applying")]
+        for entry in interrupted:
+            if entry["op"] == "renumber":
+                self._recover_renumber(entry)
+                dirty_folders.add(entry["folder"])
                 continue
 
-            logger.info(f"Processing video: {video_path.name}")
-            
-            # Check and potentially fix video date
-            video_date = check_and_fix_video_date(video_path)
-            date_str = video_date.strftime("%Y-%m-%d")
-            
-            # Create target directory
-            target_dir = source_path / "organized" / date_str
-            target_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Get existing files in target directory
-            existing_files = get_existing_files(target_dir)
-            
-            # Get quick signature of current video
-            current_signature = get_quick_file_signature(video_path)
-            
-            # Check if file already exists
-            if current_signature in existing_files:
-                logger.debug(f"Skipping {video_path.name} - already exists in {date_str}")
+            source = Path(entry["source"])
+            target = self.organized_dir / entry["target"]
+            target.with_name(f".{target.name}{PARTIAL_SUFFIX}").unlink(missing_ok=True)
+            try:
+                complete = target.exists() and target.stat().st_size == entry["size"] and \
+                    (not source.exists() or get_quick_file_signature(source) == get_quick_file_signature(target))
+                if complete:
+                    # Only deleting the source may have been left to do (never in copy mode)
+                    if not entry.get("keep_source"):
+                        source.unlink(missing_ok=True)
+                    dirty_folders.add(_top_folder(entry["target"]))
+                    logger.info(f"Completed interrupted move of {source.name} to {entry['target']}")
+                elif source.exists():
+                    logger.info(f"Rolled back interrupted move of {source.name} - left in place")
+                else:
+                    logger.error(f"Interrupted move of {source} left neither the source nor a complete target")
+            except OSError as e:
+                logger.error(f"Error recovering move of {source}: {e}")
                 continue
-            
-            # Move file to target directory
-            target_path = target_dir / video_path.name
-            if target_path.exists():
-                logger.debug(f"Target file already exists: {target_path}")
+            self.finish(entry["id"], "done" if complete else "rolled_back")
+            with self.lock:
+                self.planned.pop(entry["source"], None)
+        return dirty_folders
+
+    def _recover_renumber(self, entry: dict):
+        """
+        Put files left under temporary names back: to their old names if the first phase was
+        interrupted, or on to their new names if the second was. The folder is renumbered again.
+        """
+        folder = self.organized_dir / entry["folder"]
+        forward = entry["state"] == "applying"
+        stranded = False
+        for old_name, new_name in entry["renames"]:
+            temp = folder / f".{old_name}{RENAME_SUFFIX}"
+            try:
+                if not temp.exists():
+                    continue
+                # Never overwrite a file that already took the name; fall back to the other name
+                names = (new_name, old_name) if forward else (old_name, new_name)
+                if not any(_rename_no_clobber(temp, folder / name) for name in names):
+                    logger.error(f"Cannot restore {temp.name}: {names[0]} and {names[1]} are both taken")
+                    stranded = True
+            except OSError as e:
+                logger.error(f"Error restoring {temp}: {e}")
+                stranded = True
+        logger.info(f"Renumbering of {entry['folder']} was interrupted - "
+                    f"{'completed' if forward else 'rolled back'} and renumbering it again")
+        if not stranded:
+            # Otherwise the entry stays open, so the next recovery tries the files left behind again
+            self.finish(entry["id"], "done" if forward else "rolled_back")
+
+    def drop_planned(self):
+        """Forget moves that never started; the files are still in place and will be found again."""
+        with self.lock:
+            dropped = [entry_id for entry_id, entry in self.entries.items()
+                       if entry["op"] == "move" and entry["state"] == "planned"]
+            self.planned = {}
+        if dropped:
+            self._write([{"id": entry_id, "state": "rolled_back"} for entry_id in dropped])
+
+    def compact(self):
+        """Rewrite the journal with only its unfinished entries, or remove it if there are none."""
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+            try:
+                if not self.entries:
+                    self.path.unlink(missing_ok=True)
+                    return
+                temp = self.path.with_name(f".{self.path.name}.tmp")
+                with open(temp, 'w', encoding='utf-8') as f:
+                    f.write("".join(json.dumps(entry) + "\n" for _, entry in sorted(self.entries.items())))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp, self.path)
+            except OSError as e:
+                logger.error(f"Error compacting journal {self.path}: {e}")
+
+    def close(self):
+        self.compact()
+
+class _KeyedLocks:
+    """Hands out one lock per key, so work on different keys never waits on each other."""
+
+    def __init__(self):
+        self._locks = {}
+        self._guard = threading.Lock()
+
+    def __call__(self, key) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+_SENTINEL = object()
+
+def _format_rate(num_bytes: int, seconds: float) -> str:
+    megabytes = num_bytes / (1024 * 1024)
+    rate = megabytes / seconds if seconds > 0 else 0.0
+    return f"{megabytes:.1f} MB in {seconds:.1f}s ({rate:.1f} MB/s)"
+
+def run_pipeline(items, stages, workers: int, queue_size: int = INGEST_QUEUE_SIZE,
+                 initializer: Optional[Callable[[], None]] = None):
+    """
+    Push items through a chain of stage functions, each served by its own worker threads
+    and connected by bounded queues so a slow stage applies back-pressure.
+    A stage returns the item for the next stage, or None to drop it.
+    initializer, if given, is called at the start of each worker thread.
+    """
+    # The final queue only collects end-of-stream markers, so it is never allowed to block
+    queues = [queue.Queue(maxsize=queue_size) for _ in stages] + [queue.Queue()]
+
+    def work(stage_num, finished):
+        stage, inbox, outbox = stages[stage_num], queues[stage_num], queues[stage_num + 1]
+        if initializer is not None:
+            initializer()
+        while True:
+            item = inbox.get()
+            if item is _SENTINEL:
+                break
+            try:
+                result = stage(item)
+            except Exception as e:
+                logger.error(f"Error in ingest stage {stage.__name__}: {e}")
                 continue
-                
-            shutil.move(str(video_path), str(target_path))
+            if result is not None:
+                outbox.put(result)
+        # The last worker of a stage tells the next stage that no more items are coming
+        with finished['lock']:
+            finished['count'] += 1
+            if finished['count'] == workers:
+                for _ in range(workers):
+                    outbox.put(_SENTINEL)
+
+    threads = []
+    for stage_num in range(len(stages)):
+        finished = {'count': 0, 'lock': threading.Lock()}
+        for _ in range(workers):
+            thread = threading.Thread(target=work, args=(stage_num, finished), daemon=True)
+            thread.start()
+            threads.append(thread)
+
+    for item in items:
+        queues[0].put(item)
+    for _ in range(workers):
+        queues[0].put(_SENTINEL)
+    for thread in threads:
+        thread.join()
+
+class VideoIngester:
+    """
+    Moves new videos from the source directory into organized/<date>/.
+    Each file goes through three stages - date extraction, fingerprinting and the
+    dedupe/move decision - which overlap across files when more than one worker is used.
+    """
+
+    def __init__(self, organized_dir: Path, index: SignatureIndex, detector: DuplicateDetector,
+                 config: Optional[OrganizerConfig] = None, journal: Optional[MoveJournal] = None):
+        self.organized_dir = organized_dir
+        self.config = _config(config)
+        self.journal = journal
+        self.index = index
+        self.detector = detector
+        # Same-size files are the only possible duplicates, so dedupe decisions lock per size;
+        # target names are reserved per date folder
+        self.size_locks = _KeyedLocks()
+        self.folder_locks = _KeyedLocks()
+        self.reserved = set()
+        # Recording dates resolved (and corrected) before the pipeline starts
+        self.video_dates = {}
+        # Copy mode: clips whose corrected date goes onto the placed copy, since the card is left as it is
+        self.retimed = set()
+        # Date folders that received files and need their jumps renumbered
+        self.dirty_folders = set()
+        self.stats_lock = threading.Lock()
+        self.bytes_copied = 0
+        self.copy_seconds = 0.0
+        # Date folders known to exist, and the device they are on, so moves don't stat them each time
+        self.existing_dirs = set()
+        self.organized_dev = None
+        # Inode of each placed file -> the proxy left next to its source, for the thumbnail stage
+        self.proxies = {}
+
+    def _dedupe_folder(self, target_dir: Path) -> Optional[Path]:
+        return None if self.config.dedupe_across_archive else target_dir
+
+    def _finished(self, video_path: Path, stat_info: os.stat_result, status: str):
+        if self.journal is not None and status in ("duplicate", "skipped"):
+            self.journal.finish_move(video_path, "skipped")
+        _emit("file_finished", path=str(video_path), bytes=stat_info.st_size, status=status)
+
+    def _guarded(self, stage, first: bool = False):
+        """
+        Wrap a stage so errors and cancellation end that file with a file_finished event.
+        Files that haven't started yet are simply dropped once the run is cancelled.
+        """
+        def guarded(item):
+            video_path, stat_info = item[0], item[1]
+            try:
+                _raise_if_cancelled()
+                return stage(item)
+            except OrganizeCancelled:
+                if not first:
+                    logger.info(f"Cancelled {video_path.name} - left in place")
+                    self._finished(video_path, stat_info, "cancelled")
+            except Exception as e:
+                logger.error(f"Error processing {video_path}: {e}")
+                self._finished(video_path, stat_info, "error")
+            return None
+        guarded.__name__ = stage.__name__
+        return guarded
+
+    def date_stage(self, item: Tuple[Path, os.stat_result]) -> Optional[Tuple[Path, os.stat_result, str]]:
+        video_path, stat_info = item
+        _emit("file_started", path=str(video_path), bytes=stat_info.st_size)
+        # Skip if already in a dated folder
+        if is_in_dated_folder(video_path):
+            logger.info(f"Skipping {video_path.name} - already in a dated folder")
+            self._finished(video_path, stat_info, "skipped")
+            return None
+
+        logger.info(f"Processing video: {video_path.name}")
+
+        video_date = self.video_dates.get(video_path) or get_video_date(video_path, stat_info, self.config)
+        return video_path, stat_info, video_date.strftime("%Y-%m-%d")
+
+    def fingerprint_stage(self, item: Tuple[Path, os.stat_result, str]) -> Tuple[Path, os.stat_result, str, Optional[bytes]]:
+        video_path, stat_info, date_str = item
+        signature = self.detector.prefetch_signature(
+            video_path, self._dedupe_folder(self.organized_dir / date_str), stat_info.st_size
+        )
+        return video_path, stat_info, date_str, signature
+
+    def move_stage(self, item: Tuple[Path, os.stat_result, str, Optional[bytes]]):
+        video_path, stat_info, date_str, signature = item
+        target_dir = self.organized_dir / date_str
+
+        with self.size_locks(stat_info.st_size):
+            # Check if file already exists
+            check = self.detector.check(video_path, self._dedupe_folder(target_dir), signature, stat_info.st_size)
+            if check.duplicate:
+                existing_date = check.duplicate.relative_to(self.organized_dir).parts[0]
+                if existing_date == date_str:
+                    logger.debug(f"Skipping {video_path.name} - already exists in {date_str}")
+                else:
+                    logger.info(f"Skipping {video_path.name} - already organized as {existing_date}/{check.duplicate.name}")
+                if self.config.copy_mode:
+                    # The card keeps it, so remember it as imported rather than checking it again next time
+                    self.index.record_import(video_path, os.stat(video_path), check.duplicate, "duplicate")
+                self._finished(video_path, stat_info, "duplicate")
+                return None
+
+            # Reserve the target name so two workers never pick the same one
+            target_path = target_dir / video_path.name
+            with self.folder_locks(target_dir):
+                if target_path in self.reserved or target_path.exists():
+                    logger.debug(f"Target file already exists: {target_path}")
+                    self._finished(video_path, stat_info, "skipped")
+                    return None
+                self.reserved.add(target_path)
+
+            placed = False
+            try:
+                # Create target directory only once the file is known to be new
+                with self.folder_locks(target_dir):
+                    if target_dir not in self.existing_dirs:
+                        target_dir.mkdir(parents=True, exist_ok=True)
+                        self.existing_dirs.add(target_dir)
+                    if self.organized_dev is None:
+                        self.organized_dev = os.stat(self.organized_dir).st_dev
+                keep_source = self.config.copy_mode
+                if self.journal is not None:
+                    self.journal.start_move(video_path, target_path, keep_source)
+                try:
+                    result = transfer_file(video_path, target_path, self.config.verify_transfers,
+                                           progress=self._progress(video_path),
+                                           source_stat=stat_info, target_dev=self.organized_dev,
+                                           keep_source=keep_source, hardlink=video_path not in self.retimed)
+                except BaseException:
+                    # transfer_file removed its partial file, so the source is untouched and the
+                    # move goes back to planned for a resumed run to retry
+                    if self.journal is not None:
+                        self.journal.restore_move(video_path)
+                    raise
+                placed = True
+                if video_path in self.retimed:
+                    timestamp = self.video_dates[video_path].timestamp()
+                    os.utime(target_path, (timestamp, timestamp))
+                target_stat = self.index.add(target_path, check.signature, check.full_hash)
+                if keep_source:
+                    self.index.record_import(video_path, os.stat(video_path), target_path, result.method)
+                if self.config.thumbnails:
+                    proxy = find_proxy(video_path)
+                    if proxy is not None:
+                        with self.stats_lock:
+                            self.proxies[target_stat.st_ino] = proxy
+                cache = _metadata_cache()
+                if cache is not None:
+                    cache.move(video_path, target_path, target_stat)
+                if self.journal is not None:
+                    self.journal.finish_move(video_path)
+            finally:
+                with self.folder_locks(target_dir):
+                    self.reserved.discard(target_path)
+                    if placed:
+                        self.dirty_folders.add(date_str)
+        run = _current_run()
+        if run is not None and run.report is not None:
+            run.report.record_move(result.bytes_copied, result.seconds, result.method)
+            if result.bytes_copied:
+                run.report.record_read(result.bytes_copied)
+        if result.bytes_copied:
+            with self.stats_lock:
+                self.bytes_copied += result.bytes_copied
+                self.copy_seconds += result.seconds
+            logger.debug(f"Copied {video_path.name} with {result.method}: "
+                         f"{_format_rate(result.bytes_copied, result.seconds)}"
+                         f"{' (verified)' if result.verified else ''}")
+        if self.config.copy_mode:
+            logger.info(f"Imported {video_path.name} to {date_str} ({result.method}) - original kept")
+        else:
             logger.info(f"Moved {video_path.name} to {date_str}")
-            
-        except Exception as e:
-            logger.error(f"Error processing {video_path}: {e}")
+        self._finished(video_path, stat_info, "moved")
+        return None
+
+    def _progress(self, video_path: Path) -> Callable[[int, int], None]:
+        """
+        Progress callback for a copy: emits a bytes event per chunk, logs each quarter and
+        raises OrganizeCancelled between chunks once the run is cancelled.
+        """
+        logged = [0]
+
+        def progress(copied: int, total: int):
+            _raise_if_cancelled()
+            _emit("bytes", path=str(video_path), done=copied, total=total)
+            quarter = copied * 4 // total if total else 4
+            if quarter > logged[0]:
+                logged[0] = quarter
+                logger.debug(f"  {video_path.name}: {copied // (1024 * 1024)} of {total // (1024 * 1024)} MB")
+        return progress
+
+    def transfer_summary(self) -> str:
+        return f"Copied {_format_rate(self.bytes_copied, self.copy_seconds)} across devices"
+
+    def ingest(self, video_files: List[Tuple[Path, os.stat_result]], workers: int = 1):
+        """Ingest (path, stat) pairs from find_video_files(), serially or through a pipeline of worker threads."""
+        stages = [self._guarded(self.date_stage, first=True),
+                  self._guarded(self.fingerprint_stage), self._guarded(self.move_stage)]
+        if workers > 1:
+            run = _current_run()
+            run_pipeline(video_files, stages, workers, initializer=lambda: _bind_run(run))
+            return
+
+        for item in video_files:
+            if _cancelled():
+                break
+            for stage in stages:
+                item = stage(item)
+                if item is None:
+                    break
+
+def find_video_files(directory: Path, recursive: bool = False, config: Optional[OrganizerConfig] = None,
+                     cached: bool = False) -> List[Tuple[Path, os.stat_result]]:
+    """
+    List the video files in a directory with a single scandir pass.
+    Extensions are matched case-insensitively, and each file's stat result is returned
+    with it so later steps don't stat the file again. With recursive set, camera
+    subfolders (e.g. DCIM/100GOPRO) are scanned too, skipping hidden folders and organized/.
+    With cached set, stats already in the run's metadata cache are reused; only archive folders
+    this run keeps up to date should be listed that way, since a source file may still be growing.
+    """
+    extensions = {ext.lower() for ext in _config(config).video_extensions}
+    cache = _metadata_cache()
+    video_files = []
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and not entry.name.startswith('.') and \
+                                not (current == directory and entry.name == "organized"):
+                            pending.append(Path(entry.path))
+                        continue
+                    path = Path(entry.path)
+                    if os.path.splitext(entry.name)[1].lower() in extensions and is_valid_video_file(path):
+                        stat_info = cache.stat(path, entry.inode()) if cached and cache is not None else None
+                        if stat_info is None:
+                            stat_info = entry.stat()
+                            if cache is not None:
+                                cache.put(path, stat_info)
+                        video_files.append((path, stat_info))
+        except OSError as e:
+            logger.error(f"Error scanning {current}: {e}")
+    return video_files
+
+def find_proxy(video_path: Path) -> Optional[Path]:
+    """
+    The low-resolution proxy a GoPro wrote next to a clip, if it is there: GX010001.MP4 has
+    GL010001.LRV (GH... on older models has GL... too), and GOPR0001.MP4 has GOPR0001.LRV.
+    """
+    stems = [video_path.stem]
+    if video_path.stem[:2].upper() in ("GX", "GH"):
+        stems.insert(0, "GL" + video_path.stem[2:])
+    for stem in stems:
+        for extension in PROXY_EXTENSIONS:
+            proxy = video_path.with_name(stem + extension)
+            if proxy.is_file():
+                return proxy
+    return None
+
+def _run_ffmpeg(output: str, inputs: List[Tuple[str, dict]], options: dict) -> Optional[str]:
+    """Run ffmpeg through python-ffmpeg, writing a JPEG to output atomically. Returns an error message on failure."""
+    from ffmpeg import FFmpeg, FFmpegError
+
+    partial = os.path.join(os.path.dirname(output), f".{os.path.basename(output)}{PARTIAL_SUFFIX}")
+    command = FFmpeg().option("y").option("loglevel", "error")
+    for url, input_options in inputs:
+        command = command.input(url, input_options)
+    try:
+        command.output(partial, {"frames:v": 1, "c:v": "mjpeg", "f": "image2", "update": 1, **options}).execute()
+        if os.path.getsize(partial):
+            os.replace(partial, output)
+            return None
+        error = "no frame written"
+    except FFmpegError as e:
+        error = e.message
+    except OSError as e:
+        error = str(e)
+    if os.path.exists(partial):
+        os.unlink(partial)
+    return error
+
+def _extract_frame(source: str, output: str, size: Tuple[int, int], seek: float) -> Optional[str]:
+    """Process pool worker: save one letterboxed frame of source. Returns an error message on failure."""
+    width, height = size
+    scale = f"scale={width}:{height}:force_original_aspect_ratio=decrease,pad={width}:{height}:(ow-iw)/2:(oh-ih)/2"
+    error = None
+    # Seeking past the end of a short clip yields no frame, so fall back to its first frame
+    for position in (seek, 0.0) if seek else (0.0,):
+        error = _run_ffmpeg(output, [(source, {"ss": position})], {"vf": scale})
+        if error is None:
+            return None
+    return error
+
+def _compose_frames(frames: List[str], output: str, layout: str, width: int, height: int) -> Optional[str]:
+    """
+    Process pool worker: put equally sized images side by side ("hstack"), or pad images of
+    the given height to width and stack them ("vstack"). Returns an error message on failure.
+    """
+    if not frames:
+        return "no images to combine"
+    if layout == "hstack":
+        if len(frames) == 1:
+            partial = os.path.join(os.path.dirname(output), f".{os.path.basename(output)}{PARTIAL_SUFFIX}")
+            try:
+                shutil.copyfile(frames[0], partial)
+                os.replace(partial, output)
+            except OSError as e:
+                if os.path.exists(partial):
+                    os.unlink(partial)
+                return str(e)
+            return None
+        graph = "".join(f"[{i}:v]" for i in range(len(frames))) + f"hstack=inputs={len(frames)}"
+    elif len(frames) == 1:
+        graph = f"[0:v]pad={width}:{height}:0:0"
+    else:
+        padded = "".join(f"[{i}:v]pad={width}:{height}:0:0[row{i}];" for i in range(len(frames)))
+        graph = padded + "".join(f"[row{i}]" for i in range(len(frames))) + f"vstack=inputs={len(frames)}"
+    return _run_ffmpeg(output, [(frame, {}) for frame in frames], {"filter_complex": graph})
+
+def build_thumbnails(organized_dir: Path, index: SignatureIndex, date_dirs: List[Path],
+                     proxies: Optional[Dict[int, Path]] = None, config: Optional[OrganizerConfig] = None):
+    """
+    Build organized/.thumbnails/<date>/Jump N.jpg (one frame per video of the jump, side by side)
+    and contact_sheet.jpg (every jump, one per row) for the given date folders.
+    Frames come from the GoPro proxy (.LRV) where one is known or still sits next to the clip,
+    and from the clip itself otherwise. They are cached in organized/.index/ under the clip's
+    signature, so a clip is only decoded once however often it is renamed or renumbered; frames
+    of clips that left the archive are removed. Every image replaces its old version atomically,
+    and old strips of jumps that no longer exist are removed once the new ones are in place.
+    The ffmpeg calls run in a process pool; python-ffmpeg and an ffmpeg binary are needed.
+    """
+    config = _config(config)
+    try:
+        import ffmpeg  # noqa: F401 - python-ffmpeg, imported here so the organizer works without it
+    except ImportError:
+        logger.error("Thumbnails need the python-ffmpeg package (pipenv install)")
+        return
+    if shutil.which("ffmpeg") is None:
+        logger.error("Thumbnails need an ffmpeg binary on the PATH")
+        return
+
+    proxies = proxies or {}
+    cache_dir = organized_dir / INDEX_DIR_NAME / THUMBNAIL_CACHE_NAME
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    width, height = THUMBNAIL_SIZE
+
+    # Jumps of each folder as lists of cached frame paths, and the frames still to be extracted
+    folder_jumps = {}
+    extract = {}
+    live = index.all_signatures()
+    for date_dir in date_dirs:
+        jumps = []
+        # The folder was just renumbered, so the plan is its current layout
+        for clip in plan_folder(date_dir, config, read_manifest(date_dir, config)):
+            try:
+                key = clip.digest or index.signature(index._relative(clip.path))
+            except OSError as e:
+                logger.error(f"Error reading signature of {clip.path}: {e}")
+                continue
+            live.add(key)
+            frame = cache_dir / f"{key.hex()}_{width}x{height}.jpg"
+            if not frame.exists() and frame not in extract:
+                extract[frame] = proxies.get(clip.inode) or find_proxy(clip.path) or clip.path
+            while len(jumps) < clip.jump:
+                jumps.append([])
+            jumps[clip.jump - 1].append(frame)
+        folder_jumps[date_dir] = jumps
+
+    # Frames are named <signature>_<width>x<height>.jpg; a signature the index no longer has
+    # belongs to a clip that was deleted or changed
+    pruned = 0
+    for frame in cache_dir.glob("*_*.jpg"):
+        try:
+            if bytes.fromhex(frame.name.split('_', 1)[0]) not in live:
+                frame.unlink()
+                pruned += 1
+        except (ValueError, OSError) as e:
+            logger.debug(f"Keeping cached thumbnail {frame.name}: {e}")
+    if pruned:
+        logger.info(f"Removed {pruned} cached thumbnails of clips no longer in the archive")
+
+    with ProcessPoolExecutor(max_workers=THUMBNAIL_WORKERS) as pool:
+        failed = set()
+        futures = {frame: pool.submit(_extract_frame, str(source), str(frame), THUMBNAIL_SIZE, THUMBNAIL_SEEK_SECONDS)
+                   for frame, source in extract.items()}
+        for frame, future in futures.items():
+            error = future.result()
+            if error is not None:
+                failed.add(frame)
+                logger.error(f"Error extracting a thumbnail from {extract[frame]}: {error}")
+            elif extract[frame].suffix in PROXY_EXTENSIONS:
+                logger.debug(f"Thumbnail of {frame.name} taken from proxy {extract[frame].name}")
+        if extract:
+            logger.info(f"Extracted {len(extract) - len(failed)} thumbnails")
+        if _cancelled():
+            return
+
+        strips = {}
+        sheets = {}
+        out_dirs = []
+        for date_dir, jumps in folder_jumps.items():
+            out_dir = organized_dir / THUMBNAIL_DIR_NAME / date_dir.name
+            out_dir.mkdir(parents=True, exist_ok=True)
+            out_dirs.append(out_dir)
+            rows = []
+            for jump_num, jump_frames in enumerate(jumps, 1):
+                jump_frames = [str(frame) for frame in jump_frames if frame not in failed]
+                if jump_frames:
+                    strip = str(out_dir / f"Jump {jump_num}.jpg")
+                    strips[strip] = pool.submit(_compose_frames, jump_frames, strip, "hstack", width, height)
+                    rows.append((strip, len(jump_frames)))
+            if rows:
+                sheets[str(out_dir / "contact_sheet.jpg")] = (
+                    [strip for strip, _ in rows], max(count for _, count in rows) * width)
+
+        built = set()
+        for output, future in strips.items():
+            error = future.result()
+            if error is not None:
+                logger.error(f"Error building {output}: {error}")
+            else:
+                built.add(output)
+        # The contact sheets are stacked from the finished strips
+        futures = {output: pool.submit(_compose_frames, [row for row in rows if row in built], output,
+                                       "vstack", sheet_width, height)
+                   for output, (rows, sheet_width) in sheets.items()}
+        for output, future in futures.items():
+            error = future.result()
+            if error is not None:
+                logger.error(f"Error building {output}: {error}")
+            else:
+                built.add(output)
+
+    # Whatever wasn't rebuilt shows an old numbering (or a jump that is gone), so it goes
+    for out_dir in out_dirs:
+        for stale in out_dir.glob("*.jpg"):
+            if str(stale) not in built:
+                stale.unlink()
+    logger.info(f"Built thumbnails for {len(folder_jumps)} date folders")
+
+def _get_source_paths(config: OrganizerConfig) -> Optional[List[Path]]:
+    """Validate the configured source directories, logging why they can't be used."""
+    if not config.source_dirs:
+        logger.error("Source directory not set! Please set SOURCE_DIR or use the GUI.")
+        return None
+
+    source_paths = []
+    for source_dir in config.source_dirs:
+        source_path = Path(source_dir)
+        if not source_path.exists():
+            logger.error(f"Source directory {source_dir} does not exist!")
+            return None
+        source_paths.append(source_path)
+    return source_paths
+
+def _ingest_and_renumber(organized_dir: Path, index: SignatureIndex, detector: DuplicateDetector,
+                         sources: Dict[Path, List[Tuple[Path, os.stat_result]]],
+                         changed_folders: Set[str] = frozenset(),
+                         config: Optional[OrganizerConfig] = None, journal: Optional[MoveJournal] = None,
+                         known_dates: Optional[Dict[Path, datetime]] = None) -> VideoIngester:
+    """
+    Ingest the video files found in each source directory, then renumber jumps in the date
+    folders that changed. Several sources are ingested in parallel through one ingester, whose
+    per-size and per-folder locks keep them from clashing in shared date folders.
+    Recording dates in known_dates (from a resumed journal) are used as they are.
+    Files an earlier run already imported in copy mode are skipped without being read.
+    """
+    config = _config(config)
+    ingester = VideoIngester(organized_dir, index, detector, config, journal)
+    run = _current_run()
+
+    original_sources, sources = sources, {root: index.not_imported(files) for root, files in sources.items()}
+    for root, files in original_sources.items():
+        new_paths = {path for path, _ in sources[root]}
+        imported = [(path, stat_info) for path, stat_info in files if path not in new_paths]
+        if imported:
+            logger.info(f"Skipping {len(imported)} files in {root} - already imported")
+        for path, stat_info in imported:
+            if journal is not None:
+                journal.finish_move(path, "skipped")
+            _emit("file_finished", path=str(path), bytes=stat_info.st_size, status="skipped")
+
+    # Resolve all recording dates first so clips with an unset camera clock can be fixed together
+    with _phase("dates"):
+        video_files = [item for files in sources.values() for item in files]
+        ingester.video_dates = dict(known_dates or {})
+        unknown = [item for item in video_files if item[0] not in ingester.video_dates]
+        cache = _metadata_cache()
+        resolve = cache.video_date if cache is not None else get_video_date
+
+        def resolve_date(item):
+            _raise_if_cancelled()
+            return resolve(*item)
+        try:
+            _raise_if_cancelled()
+            with ThreadPoolExecutor(max_workers=config.ingest_workers, initializer=_bind_run, initargs=(run,)) as pool:
+                dates = pool.map(resolve_date, unknown)
+                ingester.video_dates.update(zip((path for path, _ in unknown), dates))
+        except OrganizeCancelled:
+            # Nothing is moved; the folders that changed before are still renumbered below
+            logger.info("Cancelled while reading recording dates - all files were left in place")
+            sources = {root: [] for root in sources}
+            video_files = []
+        reference_clip = Path(config.date_correction_reference_clip) if config.date_correction_reference_clip else None
+        # Each card has its own camera clock, so unset clocks are corrected per source. A single reference
+        # time or clip anchors one card's earliest clip, so it is only used when one card needs it
+        source_references = {os.path.abspath(source): reference
+                             for source, reference in config.date_correction_source_references.items()}
+        suspect_cards = [root for root, files in sources.items()
+                         if any(is_default_clock_date(ingester.video_dates[path]) for path, _ in files)]
+        shared_reference = len(suspect_cards) <= 1
+        if not shared_reference and (config.date_correction_reference or reference_clip) and \
+                any(os.path.abspath(root) not in source_references for root in suspect_cards):
+            logger.error(f"{len(suspect_cards)} sources have clips with an unset camera clock, so a single reference "
+                         f"can't be used for them - give each source its own reference time")
+        uncorrected = set()
+        date_sources = {path: "journal" for path in known_dates or {}}
+        for root, files in sources.items():
+            card_dates = {path: ingester.video_dates[path] for path, _ in files}
+            reference_time = source_references.get(os.path.abspath(root))
+            if reference_time is None and shared_reference:
+                reference_time = config.date_correction_reference
+            uncorrected.update(correct_default_clock_dates(card_dates, reference_time,
+                                                           reference_clip if shared_reference else None,
+                                                           config.date_correction_prompt, config,
+                                                           write_times=not config.copy_mode))
+            date_sources.update((path, "corrected") for path, video_date in card_dates.items()
+                                if video_date != ingester.video_dates[path])
+            ingester.video_dates.update(card_dates)
+        if config.copy_mode:
+            # The card keeps its unset clock, so the corrected time is set on the copy instead; that
+            # includes clips corrected by the interrupted run being resumed
+            ingester.retimed = {path for path, stat_info in video_files if date_sources.get(path) == "corrected" or
+                                (path in date_sources and is_default_clock_date(datetime.fromtimestamp(stat_info.st_mtime)))}
+        if cache is not None:
+            # Corrected and resumed dates are what renumbering (and the manifests) have to use too
+            for path, video_date in ingester.video_dates.items():
+                cache.set_date(path, video_date, date_sources.get(path))
+
+    for path, stat_info in video_files:
+        if path in uncorrected:
+            _emit("file_finished", path=str(path), bytes=stat_info.st_size, status="skipped")
+
+    # Process each video file
+    with _phase("ingest"):
+        pending = [[item for item in files if item[0] not in uncorrected] for files in sources.values()]
+        if journal is not None:
+            journal.plan_moves([(path, stat_info, ingester.video_dates[path], root)
+                                for root, files in zip(sources, pending) for path, stat_info in files])
+        if len(pending) == 1 and not _cancelled():
+            ingester.ingest(pending[0], config.ingest_workers)
+        elif pending and not _cancelled():
+            # One thread per source keeps every card reader busy at once
+            with ThreadPoolExecutor(max_workers=len(pending), initializer=_bind_run, initargs=(run,)) as pool:
+                list(pool.map(lambda files: ingester.ingest(files, config.ingest_workers), pending))
     
-    # Process each date directory to rename videos
-    organized_dir = source_path / "organized"
-    if organized_dir.exists():
-        for date_dir in organized_dir.iterdir():
-            if date_dir.is_dir():
-                logger.debug(f"Processing directory: {date_dir}")
-                rename_videos_in_directory(date_dir)
+    # Process each date directory that changed to rename videos. After a cancel, only the
+    # folders that already received files are renumbered, so their names stay consistent.
+    with _phase("rename"):
+        if config.renumber_all and not _cancelled():
+            date_dirs = [d for d in organized_dir.iterdir() if d.is_dir() and not d.name.startswith('.')]
+        else:
+            date_dirs = [organized_dir / name for name in sorted(set(changed_folders) | ingester.dirty_folders)]
+        date_dirs = [date_dir for date_dir in date_dirs if date_dir.is_dir()]
+        for date_dir in date_dirs:
+            logger.debug(f"Processing directory: {date_dir}")
+            rename_videos_in_directory(date_dir, index, config, journal)
+
+    if config.thumbnails and date_dirs and not _cancelled():
+        with _phase("thumbnails"):
+            build_thumbnails(organized_dir, index, date_dirs, ingester.proxies, config)
+
+    if ingester.bytes_copied:
+        logger.info(ingester.transfer_summary())
+    return ingester
+
+def _resumable_moves(journal: MoveJournal) -> Tuple[Dict[Path, List[Tuple[Path, os.stat_result]]], Dict[Path, datetime]]:
+    """
+    Files of the moves an interrupted run planned but never started, grouped by source
+    directory, and the recording dates it resolved for them.
+    """
+    sources, known_dates = {}, {}
+    for entry in journal.planned_moves():
+        path = Path(entry["source"])
+        try:
+            stat_info = path.stat()
+        except FileNotFoundError:
+            journal.finish_move(path, "rolled_back")
+            continue
+        sources.setdefault(Path(entry["root"]), []).append((path, stat_info))
+        # A file that changed since it was planned gets its date read again
+        if (stat_info.st_size, stat_info.st_mtime_ns) == (entry["size"], entry["mtime_ns"]):
+            known_dates[path] = datetime.fromisoformat(entry["date"])
+    return sources, known_dates
+
+def _phase(name: str):
+    """Time a phase of the current run, if a run report is being collected, and announce it to the event callback."""
+    _emit("phase", phase=name)
+    run = _current_run()
+    return run.report.phase(name) if run is not None and run.report is not None else nullcontext()
+
+def organize_videos(config: Optional[OrganizerConfig] = None, on_event: Optional[Callable[[dict], None]] = None,
+                    cancel_token: Optional[CancellationToken] = None) -> Optional[dict]:
+    """
+    Main function to organize videos by date.
+    config defaults to OrganizerConfig.from_globals(); with several source directories they
+    are ingested in parallel into the same organized/ tree.
+    on_event receives progress events as dicts (see _emit) and cancel_token stops the
+    run early; files already moved stay organized and everything else stays in place.
+    Returns the run report (see RunReport), which is also written to organized/.index/.
+    """
+    config = _config(config)
+    run = _Run(config, RunReport(), on_event, cancel_token)
+    previous = _current_run()
+    _bind_run(run)
+    journal = index = None
+    try:
+        source_paths = _get_source_paths(config)
+        if source_paths is None:
+            return None
+
+        # Finish or roll back whatever an interrupted run left half done
+        organized_dir = config.organized_path
+        journal = MoveJournal(organized_dir)
+        with _phase("recovery"):
+            recovered_folders = journal.recover()
+
+        known_dates = {}
+        with _phase("discovery"):
+            if config.resume:
+                # Only the moves the interrupted run planned, with the dates it already resolved
+                sources, known_dates = _resumable_moves(journal)
+            else:
+                # Get all video files in one pass per source, including camera subfolders if enabled
+                journal.drop_planned()
+                sources = {source_path: find_video_files(source_path, config.scan_subfolders, config)
+                           for source_path in source_paths}
+        video_files = [item for files in sources.values() for item in files]
+        _emit("discovered", files=len(video_files), bytes=sum(stat_info.st_size for _, stat_info in video_files))
+
+        # Without new videos there is still work if organized/ changed since the last run
+        if not video_files:
+            logger.info("No interrupted moves to resume." if config.resume else
+                        "No video files found in the source directory.")
+            if not organized_dir.exists():
+                return None
+
+        # Open the persistent signature index and sync it with organized/ using stat data only;
+        # folders that changed outside of this tool need renumbering too
+        with _phase("index"):
+            index = SignatureIndex(organized_dir)
+            try:
+                changed_folders = index.refresh() | recovered_folders
+            except OrganizeCancelled:
+                # Only the folders recovery touched are renumbered; nothing else runs once cancelled
+                changed_folders = recovered_folders
+        detector = DuplicateDetector(index)
+
+        _ingest_and_renumber(organized_dir, index, detector, sources, changed_folders, config, journal, known_dates)
+
+        if video_files:
+            logger.info(detector.summary())
+        run.report.cancelled = _cancelled()
+        run.report.metadata_cache = run.cache.to_dict()
+        run.report.devices = run.scheduler.to_dict()
+        logger.debug(f"Metadata cache: {run.report.metadata_cache['hits']} hits, "
+                     f"{run.report.metadata_cache['misses']} misses")
+        if run.report.cancelled:
+            logger.info("Organization cancelled - remaining files were left in place")
+        logger.info(run.report.summary())
+        return run.report.write(organized_dir, config.run_report_path)
+    finally:
+        if index is not None:
+            index.close()
+        if journal is not None:
+            journal.close()
+        _emit("finished", cancelled=_cancelled())
+        _bind_run(previous)
+
+class _PollingWatcher:
+    """Fallback watcher that simply wakes up every poll interval; changes are found by diffing stat results."""
+
+    def __init__(self, poll_interval: float):
+        self.poll_interval = poll_interval
+
+    def watch_tree(self, directory: Path, recursive: bool):
+        pass
+
+    def wait(self, timeout: Optional[float], stop_event: threading.Event) -> bool:
+        """Sleep until the next poll. Always asks for a rescan, since polling can't tell what changed."""
+        stop_event.wait(self.poll_interval if timeout is None else min(timeout, self.poll_interval))
+        return True
+
+    def close(self):
+        pass
+
+class _InotifyWatcher:
+    """Linux watcher that sleeps until inotify reports a change in the watched directories."""
+
+    def __init__(self):
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watched = set()
+
+    def _add_watch(self, directory: Path):
+        if directory in self.watched:
+            return
+        if self.libc.inotify_add_watch(self.fd, os.fsencode(directory), INOTIFY_MASK) < 0:
+            logger.warning(f"Cannot watch {directory}: {os.strerror(ctypes.get_errno())}")
+            return
+        self.watched.add(directory)
+
+    def watch_tree(self, directory: Path, recursive: bool):
+        """Watch the directory, and with recursive set every subfolder find_video_files() would scan."""
+        self._add_watch(directory)
+        if not recursive:
+            return
+        for root, dirs, _ in os.walk(directory):
+            dirs[:] = [d for d in dirs if not d.startswith('.') and not (Path(root) == directory and d == "organized")]
+            for name in dirs:
+                self._add_watch(Path(root) / name)
+
+    def wait(self, timeout: Optional[float], stop_event: threading.Event) -> bool:
+        """Sleep until a change or the timeout. Returns whether anything changed."""
+        # Wake up regularly to notice stop_event even without file activity
+        ready, _, _ = select.select([self.fd], [], [], WATCH_POLL_INTERVAL if timeout is None else timeout)
+        if not ready:
+            return False
+        try:
+            while os.read(self.fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self):
+        os.close(self.fd)
+
+def _make_watcher(use_inotify: bool):
+    if use_inotify and sys.platform.startswith('linux'):
+        try:
+            return _InotifyWatcher()
+        except (OSError, AttributeError) as e:
+            logger.warning(f"inotify unavailable ({e}), falling back to polling")
+    return _PollingWatcher(WATCH_POLL_INTERVAL)
+
+class _StabilityTracker:
+    """Tracks the size and mtime of each file and reports files that stopped changing for the settle time."""
+
+    def __init__(self, settle_seconds: float):
+        self.settle_seconds = settle_seconds
+        self.files = {}  # path -> ((size, mtime_ns), first time seen with that size and mtime)
+
+    def update(self, video_files: List[Tuple[Path, os.stat_result]], now: float) -> Tuple[List, Optional[float]]:
+        """Returns the files that finished writing, and how long until the next pending file might."""
+        ready = []
+        next_check = None
+        files = {}
+        for path, stat_info in video_files:
+            key = (stat_info.st_size, stat_info.st_mtime_ns)
+            previous = self.files.get(path)
+            since = previous[1] if previous and previous[0] == key else now
+            files[path] = (key, since)
+            remaining = self.settle_seconds - (now - since)
+            if remaining <= 0:
+                ready.append((path, stat_info))
+            elif next_check is None or remaining < next_check:
+                next_check = remaining
+        self.files = files
+        return ready, next_check
+
+def watch_videos(config: Optional[OrganizerConfig] = None, stop_event: Optional[threading.Event] = None,
+                 use_inotify: bool = True):
+    """
+    Keep organizing new videos as they appear in the source directories.
+    Uses inotify where available and otherwise polls. A file is ingested once its size and
+    mtime have been stable for the settle time, and only new files are processed,
+    without rescanning organized/. Runs until stop_event is set or the process is interrupted.
+    """
+    config = _config(config)
+    previous = _current_run()
+    _bind_run(_Run(config))
+    try:
+        source_paths = _get_source_paths(config)
+        if source_paths is None:
+            return
+        _watch_sources(config, source_paths, stop_event or threading.Event(), use_inotify)
+    finally:
+        _bind_run(previous)
+
+def _watch_sources(config: OrganizerConfig, source_paths: List[Path], stop_event: threading.Event, use_inotify: bool):
+    organized_dir = config.organized_path
+    journal = MoveJournal(organized_dir)
+    index = detector = watcher = None
+    try:
+        recovered_folders = journal.recover()
+        journal.drop_planned()
+        index = SignatureIndex(organized_dir)
+        changed_folders = index.refresh() | recovered_folders
+        detector = DuplicateDetector(index)
+        watcher = _make_watcher(use_inotify)
+        tracker = _StabilityTracker(config.watch_settle_seconds)
+        # Files left in place (duplicates, name clashes) are not retried until they change
+        handled = {}
+        logger.info(f"Watching {', '.join(str(path) for path in source_paths)} for new videos")
+
+        scan_needed = True
+        next_check = None
+        while not stop_event.is_set():
+            if scan_needed:
+                sources = {}
+                for source_path in source_paths:
+                    watcher.watch_tree(source_path, config.scan_subfolders)
+                    sources[source_path] = find_video_files(source_path, config.scan_subfolders, config)
+                video_files = [item for files in sources.values() for item in files]
+                ready, next_check = tracker.update(video_files, time.monotonic())
+                new_files = {path for path, stat_info in ready
+                             if handled.get(path) != (stat_info.st_size, stat_info.st_mtime_ns)}
+                if new_files or changed_folders:
+                    logger.info(f"Organizing {len(new_files)} new videos")
+                    new_sources = {root: [item for item in files if item[0] in new_files]
+                                   for root, files in sources.items()}
+                    _ingest_and_renumber(organized_dir, index, detector, new_sources, changed_folders, config, journal)
+                    journal.compact()
+                    # Cached metadata is only trusted within one batch
+                    _current_run().cache = MetadataCache()
+                    changed_folders = set()
+                    for path, stat_info in video_files:
+                        if path in new_files:
+                            handled[path] = (stat_info.st_size, stat_info.st_mtime_ns)
+                present = {path for path, _ in video_files}
+                handled = {path: key for path, key in handled.items() if path in present}
+            # Rescan on file activity, or when a file still settling may have become ready
+            scan_needed = watcher.wait(next_check, stop_event) or next_check is not None
+    except KeyboardInterrupt:
+        logger.info("Stopped watching")
+    finally:
+        if watcher is not None:
+            watcher.close()
+        if detector is not None:
+            logger.info(detector.summary())
+        if index is not None:
+            index.close()
+        journal.close()
+
+def _parse_reference_time(value: str) -> Tuple[str, datetime]:
+    """Parse a --reference-time value: "YYYY-MM-DD HH:MM:SS", optionally prefixed with "SOURCE_DIR=". """
+    source, _, time_str = value.rpartition("=")
+    try:
+        return source, datetime.strptime(time_str.strip(), "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid reference time {value!r}, expected [SOURCE_DIR=]YYYY-MM-DD HH:MM:SS")
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Organize skydiving videos into date folders and jumps.")
+    parser.add_argument("source_dirs", nargs="*", metavar="source_dir",
+                        help="Directory containing the videos to organize; several are ingested in parallel")
+    parser.add_argument("--organized",
+                        help="Folder to organize into (default: organized/ inside the first source directory)")
+    parser.add_argument("--renumber-all", action="store_true",
+                        help="Renumber jumps in every date folder, not only the ones that changed")
+    parser.add_argument("--reference-time", action="append", default=[], type=_parse_reference_time,
+                        help="Real recording time (\"YYYY-MM-DD HH:MM:SS\") of the earliest clip with an unset camera clock; "
+                             "with several sources, give one per source as \"SOURCE_DIR=YYYY-MM-DD HH:MM:SS\"")
+    parser.add_argument("--reference-clip",
+                        help="Clip with a correct time recorded at the same moment as the earliest clip with an unset camera clock")
+    parser.add_argument("--container-utc", action="store_true",
+                        help="Recording times in the video files are UTC (most phones and drones); GoPro cameras store local time")
+    parser.add_argument("--copy", action="store_true",
+                        help="Keep the source files, reflinking or hardlinking them into organized/ where possible")
+    parser.add_argument("--device-streams", type=int, default=DEVICE_STREAMS, metavar="N",
+                        help="Copies and full-file hashes to run at once on each drive (default 1, for spinning disks)")
+    parser.add_argument("--thumbnails", action="store_true",
+                        help="Build a thumbnail strip per jump and a contact sheet per date in organized/.thumbnails")
+    parser.add_argument("--report",
+                        help="Also write the JSON run report to this file")
+    parser.add_argument("--resume", action="store_true",
+                        help="Only finish the moves an interrupted run had planned, without scanning the sources")
+    parser.add_argument("--plan-renames", action="store_true",
+                        help="Print the renames renumbering every date folder would make as JSON, and change nothing")
+    parser.add_argument("--preview-thresholds", metavar="MINUTES",
+                        help="Print as JSON how many jumps each date would get with each comma-separated "
+                             "threshold (e.g. 10,15,20,30), and change nothing")
+    parser.add_argument("--jump-threshold", type=float, metavar="MINUTES",
+                        help=f"Clips recorded within this many minutes of each other are one jump (default: the "
+                             f"threshold of the last --regroup, else {JUMP_TIME_THRESHOLD.total_seconds() / 60:g})")
+    parser.add_argument("--regroup", type=float, metavar="MINUTES",
+                        help="Renumber the archive for this jump time threshold, only in folders whose numbering changes")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and organize new videos as they finish copying")
+    parser.add_argument("--poll", action="store_true",
+                        help="With --watch, poll for changes instead of using inotify")
+    parser.add_argument("--settle", type=float, default=WATCH_SETTLE_SECONDS,
+                        help="With --watch, seconds a file must stop changing before it is organized")
+    args = parser.parse_args()
+
+    config = OrganizerConfig.from_globals()
+    config = config._replace(
+        source_dirs=tuple(args.source_dirs) or config.source_dirs,
+        organized_dir=args.organized or config.organized_dir,
+        renumber_all=args.renumber_all or config.renumber_all,
+        copy_mode=args.copy or config.copy_mode,
+        container_times_are_utc=args.container_utc or config.container_times_are_utc,
+        device_streams=args.device_streams,
+        thumbnails=args.thumbnails or config.thumbnails,
+        watch_settle_seconds=args.settle,
+        date_correction_reference=next((time for source, time in args.reference_time if not source),
+                                       config.date_correction_reference),
+        date_correction_source_references={**config.date_correction_source_references,
+                                           **{source: time for source, time in args.reference_time if source}},
+        date_correction_reference_clip=args.reference_clip or config.date_correction_reference_clip,
+        run_report_path=args.report or config.run_report_path,
+        resume=args.resume,
+        # Only ask when someone is there to answer
+        date_correction_prompt=sys.stdin.isatty(),
+    )
+    if args.jump_threshold is not None:
+        config = config._replace(jump_time_threshold=timedelta(minutes=args.jump_threshold))
+    elif config.source_dirs or config.organized_dir:
+        stored = stored_jump_threshold(config.organized_path)
+        if stored is not None and stored != config.jump_time_threshold:
+            logger.info(f"Using the archive's jump time threshold of {stored.total_seconds() / 60:g} minutes")
+            config = config._replace(jump_time_threshold=stored)
+    if args.plan_renames:
+        print(json.dumps(plan_archive_renames(config), indent=2))
+    elif args.preview_thresholds:
+        thresholds = [timedelta(minutes=float(value)) for value in args.preview_thresholds.split(",")]
+        print(json.dumps(preview_thresholds(load_archive_timeline(config), thresholds), indent=2))
+    elif args.regroup is not None:
+        regroup_archive(timedelta(minutes=args.regroup), config)
+    elif args.watch:
+        watch_videos(config, use_inotify=not args.poll)
+    else:
+        organize_videos(config)
 
 if __name__ == "__main__":
-    organize_videos() 
\ No newline at end of file
+    main() 
\ No newline at end of file
@@ -1,97 +1,281 @@
 #!/usr/bin/env python3
 
 import sys
-import os
 import time
+import threading
+import multiprocessing
 from pathlib import Path
 from datetime import datetime
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QPushButton, QLabel, QTextEdit, QFileDialog, QProgressBar,
-    QGroupBox, QCheckBox, QSpinBox, QLineEdit, QMessageBox
+    QPushButton, QLabel, QPlainTextEdit, QFileDialog, QProgressBar,
+    QGroupBox, QCheckBox, QSpinBox, QLineEdit, QMessageBox,
+    QTabWidget, QTableView, QHeaderView, QDialog, QDialogButtonBox
 )
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QThread, QTimer, Signal, Qt, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QFont
 import organize_videos
 import logging
 
+LOG_FLUSH_INTERVAL_MS = 200  # How often buffered log lines are moved into the log view
+LOG_VIEW_MAX_LINES = 5000  # Older lines are dropped from the log view; the log file keeps everything
+LOG_FILE = Path.home() / ".skydiving_video_organizer" / "organizer.log"
+PROGRESS_STEPS = 1000  # Resolution of the progress bar
+PREVIEW_THRESHOLDS = range(5, 65, 5)  # Jump time thresholds (minutes) compared in the threshold preview
+LIBRARY_FETCH_ROWS = 500  # Clips the library loads from the manifests each time the view scrolls near the end
+
+class BufferedLogger:
+    """
+    Stands in for organize_videos.logger while a run is in progress.
+    Lines are collected in memory for the GUI to pick up in batches instead of
+    one signal per line, and every line (including debug) is appended to LOG_FILE, which is
+    flushed each time the GUI takes a batch so a crash or hang loses at most one timer tick.
+    """
+    
+    def __init__(self, log_file):
+        self.level = logging.INFO
+        self.lines = []
+        self.lock = threading.Lock()
+        try:
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            self.file = open(log_file, 'a', encoding='utf-8')
+        except OSError:
+            self.file = None
+    
+    def _log(self, level, prefix, msg):
+        now = datetime.now()
+        with self.lock:
+            if self.file:
+                self.file.write(f"{now.strftime('%Y-%m-%d %H:%M:%S')} - {prefix}{msg}\n")
+            if level >= self.level:
+                self.lines.append(f"{now.strftime('%H:%M:%S')} - {prefix}{msg}")
+    
+    def message(self, msg):
+        self._log(logging.CRITICAL, "", msg)
+    
+    def info(self, msg):
+        self._log(logging.INFO, "INFO: ", msg)
+    
+    def error(self, msg):
+        self._log(logging.ERROR, "ERROR: ", msg)
+    
+    def debug(self, msg):
+        self._log(logging.DEBUG, "DEBUG: ", msg)
+    
+    def warning(self, msg):
+        self._log(logging.WARNING, "WARNING: ", msg)
+    
+    def setLevel(self, level):
+        self.level = level
+    
+    def getEffectiveLevel(self):
+        return self.level
+    
+    def take_lines(self):
+        """Hand over the lines collected since the last call, and flush the log file."""
+        with self.lock:
+            lines, self.lines = self.lines, []
+            if self.file:
+                try:
+                    self.file.flush()
+                except OSError:
+                    pass
+        return lines
+    
+    def close(self):
+        with self.lock:
+            if self.file:
+                self.file.close()
+                self.file = None
+
 class VideoOrganizerThread(QThread):
     """Thread for running video organization in background"""
-    progress_signal = Signal(str)
     finished_signal = Signal(bool, str)
+    report_signal = Signal(dict)
     
-    def __init__(self, source_dir, config):
+    def __init__(self, source_dirs, config):
         super().__init__()
-        self.source_dir = source_dir
+        self.source_dirs = source_dirs
         self.config = config
         self.is_running = False
+        self.logger = BufferedLogger(LOG_FILE)
+        self.cancel_token = organize_videos.CancellationToken()
+        # Progress collected from organizer events, read by the GUI timer
+        self.progress_lock = threading.Lock()
+        self.phase = ""
+        self.total_files = 0
+        self.total_bytes = 0
+        self.done_files = 0
+        self.done_bytes = 0
+        self.in_flight = {}
+        self.started = time.monotonic()
+    
+    def take_log_lines(self):
+        return self.logger.take_lines()
+    
+    def cancel(self):
+        self.cancel_token.cancel()
+    
+    def handle_event(self, event):
+        """Event callback for organize_videos; called from worker threads, so it only updates counters."""
+        with self.progress_lock:
+            if event['type'] == 'phase':
+                self.phase = event['phase']
+            elif event['type'] == 'discovered':
+                self.total_files = event['files']
+                self.total_bytes = event['bytes']
+                self.started = time.monotonic()
+            elif event['type'] == 'bytes':
+                self.in_flight[event['path']] = event['done']
+            elif event['type'] == 'file_finished':
+                self.in_flight.pop(event['path'], None)
+                self.done_files += 1
+                self.done_bytes += event['bytes']
+    
+    def progress(self):
+        """Return (phase, files done, total files, bytes done, total bytes, seconds since discovery)."""
+        with self.progress_lock:
+            return (self.phase, self.done_files, self.total_files,
+                    self.done_bytes + sum(self.in_flight.values()), self.total_bytes,
+                    time.monotonic() - self.started)
         
     def run(self):
         try:
             self.is_running = True
-            self.progress_signal.emit("Starting video organization...")
-            
-            # Redirect logging to our signal
-            original_logger = organize_videos.logger
-            
-            class SignalLogger:
-                def __init__(self, signal):
-                    self.signal = signal
-                    self.level = logging.INFO
-                
-                def info(self, msg):
-                    self.signal.emit(f"INFO: {msg}")
-                
-                def error(self, msg):
-                    self.signal.emit(f"ERROR: {msg}")
-                
-                def debug(self, msg):
-                    # Only show debug messages if level is DEBUG
-                    if self.level <= logging.DEBUG:
-                        self.signal.emit(f"DEBUG: {msg}")
-                
-                def warning(self, msg):
-                    self.signal.emit(f"WARNING: {msg}")
-                
-                def setLevel(self, level):
-                    self.level = level
-                
-                def getEffectiveLevel(self):
-                    return self.level
-            
-            # Create and configure the signal logger
-            signal_logger = SignalLogger(self.progress_signal)
-            signal_logger.setLevel(logging.INFO)
-            
-            # Replace the original logger
-            organize_videos.logger = signal_logger
-            
-            # Also configure the root logger to INFO level
-            logging.getLogger().setLevel(logging.INFO)
-            
-            # Update configuration
-            organize_videos.SOURCE_DIR = self.source_dir
-            organize_videos.VIDEO_EXTENSIONS = set(self.config['extensions'])
-            organize_videos.JUMP_TIME_THRESHOLD = organize_videos.timedelta(minutes=self.config['jump_threshold'])
-            organize_videos.PRESERVE_NAMES = self.config['preserve_names']
+            self.logger.message("Starting video organization...")
+            
+            # Settings for this run only; the organizer logs to our buffer
+            run_config = organize_videos.OrganizerConfig.from_globals(
+                source_dirs=tuple(self.source_dirs),
+                video_extensions=frozenset(self.config['extensions']),
+                jump_time_threshold=organize_videos.timedelta(minutes=self.config['jump_threshold']),
+                preserve_names=self.config['preserve_names'],
+                ingest_workers=self.config['workers'],
+                device_streams=self.config['device_streams'],
+                scan_subfolders=self.config['scan_subfolders'],
+                renumber_all=self.config['renumber_all'],
+                verify_transfers=self.config['verify_transfers'],
+                container_times_are_utc=self.config['container_times_are_utc'],
+                copy_mode=self.config['copy_mode'],
+                thumbnails=self.config['thumbnails'],
+                date_correction_reference=self.config['reference_time'],
+                date_correction_prompt=False,
+                resume=self.config['resume'],
+                logger=self.logger,
+            )
             
             # Run the organization
-            organize_videos.organize_videos()
+            report = organize_videos.organize_videos(run_config, self.handle_event, self.cancel_token)
+            if report:
+                self.report_signal.emit(report)
             
-            self.progress_signal.emit("Video organization completed successfully!")
-            self.finished_signal.emit(True, "Organization completed successfully!")
+            if self.cancel_token.cancelled:
+                self.logger.message("Video organization cancelled.")
+                self.finished_signal.emit(True, "Organization cancelled. Files not yet moved were left in place.")
+            else:
+                self.logger.message("Video organization completed successfully!")
+                self.finished_signal.emit(True, "Organization completed successfully!")
             
         except Exception as e:
-            self.progress_signal.emit(f"Error during organization: {str(e)}")
+            self.logger.message(f"Error during organization: {str(e)}")
             self.finished_signal.emit(False, f"Error: {str(e)}")
         finally:
             self.is_running = False
-            organize_videos.logger = original_logger
+
+class ArchiveTaskThread(QThread):
+    """Runs an archive-wide step (threshold preview, regrouping) off the UI thread; it may read or rename every clip."""
+    finished_signal = Signal(object, str)  # Result, and the error message if it failed
+    
+    def __init__(self, function):
+        super().__init__()
+        self.function = function
+    
+    def run(self):
+        try:
+            self.finished_signal.emit(self.function(), "")
+        except Exception as e:
+            self.finished_signal.emit(None, str(e))
+
+class LibraryModel(QAbstractTableModel):
+    """
+    Clips of an organized archive, read from the .manifest.json of each date folder.
+    Only the list of date folders is read up front; manifests are loaded a few at a time
+    as the view scrolls (canFetchMore/fetchMore), and cells are formatted only when shown.
+    """
+    COLUMNS = ("Date", "Jump", "Video", "Recorded", "Name", "Original Name", "Size (MB)", "Time Source")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.folders = []
+        self.next_folder = 0
+        self.rows = []  # (date folder name, manifest clip entry)
+        self.missing = []  # Date folders without a usable manifest
+        self.config = None
+    
+    def load(self, organized_dir, config=None):
+        self.beginResetModel()
+        self.config = config
+        self.folders = organize_videos.manifest_folders(organized_dir) if organized_dir.is_dir() else []
+        self.next_folder = 0
+        self.rows = []
+        self.missing = []
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        folder, clip = self.rows[index.row()]
+        column = index.column()
+        if column == 0:
+            return folder
+        if column == 1:
+            return clip['jump']
+        if column == 2:
+            return clip['video']
+        if column == 3:
+            return clip['recorded'].replace('T', ' ')
+        if column == 4:
+            return clip['name']
+        if column == 5:
+            return clip['original']
+        if column == 6:
+            return f"{clip['size'] / (1024 * 1024):.1f}"
+        return clip['time_source'] or ""
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.next_folder < len(self.folders)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        new_rows = []
+        while self.next_folder < len(self.folders) and len(new_rows) < LIBRARY_FETCH_ROWS:
+            folder = self.folders[self.next_folder]
+            self.next_folder += 1
+            manifest = organize_videos.read_manifest(folder, self.config)
+            if manifest is None:
+                self.missing.append(folder.name)
+                continue
+            new_rows.extend((folder.name, clip) for clip in manifest['clips'])
+        if new_rows:
+            self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(new_rows) - 1)
+            self.rows.extend(new_rows)
+            self.endInsertRows()
 
 class VideoOrganizerGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.organizer_thread = None
+        self.archive_thread = None
         self.init_ui()
         
     def init_ui(self):
@@ -226,7 +410,7 @@ class VideoOrganizerGUI(QMainWindow):
                 border: 2px solid #6c5ce7;
             }
             
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #3a3a4e;
                 border: 1px solid #4a4a5e;
                 border-radius: 16px;
@@ -244,7 +428,7 @@ class VideoOrganizerGUI(QMainWindow):
                 font-weight: 400;
             }
             
-            QTableWidget {
+            QTableView {
                 background-color: #3a3a4e;
                 border: 1px solid #4a4a5e;
                 border-radius: 16px;
@@ -253,12 +437,12 @@ class VideoOrganizerGUI(QMainWindow):
                 selection-background-color: #6c5ce7;
             }
             
-            QTableWidget::item {
+            QTableView::item {
                 padding: 12px;
                 border-bottom: 1px solid #2a2a3e;
             }
             
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #6c5ce7;
                 color: #ffffff;
             }
@@ -287,9 +471,11 @@ class VideoOrganizerGUI(QMainWindow):
             }
         """)
         
-        # Create central widget and main layout
+        # Organize and Library tabs
+        tabs = QTabWidget()
+        self.setCentralWidget(tabs)
         central_widget = QWidget()
-        self.setCentralWidget(central_widget)
+        tabs.addTab(central_widget, "Organize")
         main_layout = QVBoxLayout(central_widget)
         
         # Source directory selection
@@ -304,6 +490,12 @@ class VideoOrganizerGUI(QMainWindow):
         browse_btn.clicked.connect(self.browse_source_directory)
         source_layout.addWidget(browse_btn)
         
+        # Further card readers are ingested in parallel into the first directory's organized/ folder
+        add_source_btn = QPushButton("Add...")
+        add_source_btn.setToolTip("Add another card to ingest at the same time")
+        add_source_btn.clicked.connect(self.add_source_directory)
+        source_layout.addWidget(add_source_btn)
+        
         main_layout.addWidget(source_group)
         
         # Configuration group
@@ -321,12 +513,53 @@ class VideoOrganizerGUI(QMainWindow):
         threshold_layout = QHBoxLayout()
         threshold_layout.addWidget(QLabel("Jump Time Threshold (minutes):"))
         self.jump_threshold_spin = QSpinBox()
-        self.jump_threshold_spin.setRange(1, 60)
+        self.jump_threshold_spin.setRange(1, 24 * 60)
         self.jump_threshold_spin.setValue(20)
         threshold_layout.addWidget(self.jump_threshold_spin)
+        self.preview_threshold_btn = QPushButton("Preview...")
+        self.preview_threshold_btn.setToolTip("See how many jumps each date in the archive would get with other thresholds")
+        self.preview_threshold_btn.clicked.connect(self.preview_jump_threshold)
+        threshold_layout.addWidget(self.preview_threshold_btn)
         threshold_layout.addStretch()
         config_layout.addLayout(threshold_layout)
         
+        # Reference time for clips recorded with an unset camera clock
+        reference_layout = QHBoxLayout()
+        reference_layout.addWidget(QLabel("Unset Clock Reference Time:"))
+        self.reference_time_edit = QLineEdit()
+        self.reference_time_edit.setPlaceholderText("YYYY-MM-DD HH:MM:SS of the first clip dated early 2016 (optional)")
+        self.reference_time_edit.setToolTip("Only used when a single source has clips with an unset clock; "
+                                            "cards with different clocks need the command line's per-source --reference-time")
+        reference_layout.addWidget(self.reference_time_edit)
+        config_layout.addLayout(reference_layout)
+        
+        # Time zone of the recording times stored in the video files
+        container_utc_layout = QHBoxLayout()
+        self.container_utc_checkbox = QCheckBox("Camera stores recording times in UTC (not GoPro)")
+        self.container_utc_checkbox.setToolTip("GoPro cameras store local time. Leave unchecked unless clips land "
+                                               "a whole number of hours off; clearly mismatched clips fall back to file times.")
+        self.container_utc_checkbox.setChecked(organize_videos.CONTAINER_TIMES_ARE_UTC)
+        container_utc_layout.addWidget(self.container_utc_checkbox)
+        container_utc_layout.addStretch()
+        config_layout.addLayout(container_utc_layout)
+        
+        # Ingest workers
+        workers_layout = QHBoxLayout()
+        workers_layout.addWidget(QLabel("Ingest Workers:"))
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(1, 16)
+        self.workers_spin.setValue(organize_videos.INGEST_WORKERS)
+        self.workers_spin.setToolTip("Files processed in parallel. Use 1 to process one file at a time.")
+        workers_layout.addWidget(self.workers_spin)
+        workers_layout.addWidget(QLabel("Copies per Drive:"))
+        self.device_streams_spin = QSpinBox()
+        self.device_streams_spin.setRange(1, 16)
+        self.device_streams_spin.setValue(organize_videos.DEVICE_STREAMS)
+        self.device_streams_spin.setToolTip("Copies run at once on each drive. Keep 1 for spinning disks; raise for SSDs.")
+        workers_layout.addWidget(self.device_streams_spin)
+        workers_layout.addStretch()
+        config_layout.addLayout(workers_layout)
+        
         # Preserve video names option
         preserve_layout = QHBoxLayout()
         self.preserve_names_checkbox = QCheckBox("Preserve original video names in parentheses")
@@ -335,6 +568,56 @@ class VideoOrganizerGUI(QMainWindow):
         preserve_layout.addStretch()
         config_layout.addLayout(preserve_layout)
         
+        # Camera subfolder scanning option
+        subfolders_layout = QHBoxLayout()
+        self.scan_subfolders_checkbox = QCheckBox("Include camera subfolders (e.g. DCIM/100GOPRO)")
+        self.scan_subfolders_checkbox.setChecked(organize_videos.SCAN_SUBFOLDERS)
+        subfolders_layout.addWidget(self.scan_subfolders_checkbox)
+        subfolders_layout.addStretch()
+        config_layout.addLayout(subfolders_layout)
+        
+        # Renumber everything option
+        renumber_layout = QHBoxLayout()
+        self.renumber_all_checkbox = QCheckBox("Renumber jumps in all date folders (not only changed ones)")
+        self.renumber_all_checkbox.setChecked(organize_videos.RENUMBER_ALL)
+        renumber_layout.addWidget(self.renumber_all_checkbox)
+        renumber_layout.addStretch()
+        config_layout.addLayout(renumber_layout)
+        
+        # Copy verification option
+        verify_layout = QHBoxLayout()
+        self.verify_transfers_checkbox = QCheckBox("Verify copies before deleting originals")
+        self.verify_transfers_checkbox.setChecked(organize_videos.VERIFY_TRANSFERS)
+        verify_layout.addWidget(self.verify_transfers_checkbox)
+        verify_layout.addStretch()
+        config_layout.addLayout(verify_layout)
+        
+        # Copy mode option
+        copy_layout = QHBoxLayout()
+        self.copy_mode_checkbox = QCheckBox("Keep originals on the card (copy instead of move)")
+        self.copy_mode_checkbox.setToolTip("Uses reflinks or hardlinks where the filesystem allows, so no data is copied")
+        self.copy_mode_checkbox.setChecked(organize_videos.COPY_MODE)
+        copy_layout.addWidget(self.copy_mode_checkbox)
+        copy_layout.addStretch()
+        config_layout.addLayout(copy_layout)
+        
+        # Thumbnail option
+        thumbnails_layout = QHBoxLayout()
+        self.thumbnails_checkbox = QCheckBox("Build jump thumbnails and contact sheets (needs ffmpeg)")
+        self.thumbnails_checkbox.setToolTip("Written to organized/.thumbnails, using GoPro .LRV proxies where available")
+        self.thumbnails_checkbox.setChecked(organize_videos.THUMBNAILS)
+        thumbnails_layout.addWidget(self.thumbnails_checkbox)
+        thumbnails_layout.addStretch()
+        config_layout.addLayout(thumbnails_layout)
+        
+        # Resume option
+        resume_layout = QHBoxLayout()
+        self.resume_checkbox = QCheckBox("Only resume the moves of an interrupted run")
+        self.resume_checkbox.setToolTip("Finishes what the last run planned without scanning the source again")
+        resume_layout.addWidget(self.resume_checkbox)
+        resume_layout.addStretch()
+        config_layout.addLayout(resume_layout)
+        
         main_layout.addWidget(config_group)
         
         # Action buttons
@@ -344,24 +627,48 @@ class VideoOrganizerGUI(QMainWindow):
         self.organize_btn.clicked.connect(self.start_organization)
         button_layout.addWidget(self.organize_btn)
         
-
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.clicked.connect(self.cancel_organization)
+        self.cancel_btn.setVisible(False)
+        button_layout.addWidget(self.cancel_btn)
         
         button_layout.addStretch()
         main_layout.addLayout(button_layout)
         
-        # Progress bar
+        # Progress bar, measured in bytes of the files discovered, with an ETA next to it
+        progress_layout = QHBoxLayout()
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        main_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.progress_bar, 1)
+        self.progress_label = QLabel()
+        self.progress_label.setVisible(False)
+        progress_layout.addWidget(self.progress_label)
+        main_layout.addLayout(progress_layout)
+        
+        # Run summary, filled in from the run report once a run finishes
+        self.summary_group = QGroupBox("Run Summary")
+        summary_layout = QVBoxLayout(self.summary_group)
+        self.summary_label = QLabel()
+        self.summary_label.setFont(QFont("Menlo", 12))
+        summary_layout.addWidget(self.summary_label)
+        self.summary_group.setVisible(False)
+        main_layout.addWidget(self.summary_group)
         
         # Log output
         log_group = QGroupBox("Log Output")
         log_layout = QVBoxLayout(log_group)
         
-        self.log_output = QTextEdit()
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(LOG_VIEW_MAX_LINES)
         log_layout.addWidget(self.log_output)
         
+        # Log lines and progress from a running organization are picked up in batches
+        self.log_timer = QTimer(self)
+        self.log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self.log_timer.timeout.connect(self.flush_log)
+        self.log_timer.timeout.connect(self.update_progress)
+        
         # Clear log button
         clear_log_btn = QPushButton("Clear Log")
         clear_log_btn.clicked.connect(self.log_output.clear)
@@ -369,23 +676,195 @@ class VideoOrganizerGUI(QMainWindow):
         
         main_layout.addWidget(log_group)
         
-        # Set default source directory (empty - user must select)
-        self.source_directory = ""
+        tabs.addTab(self.create_library_tab(), "Library")
+        
+        # Set default source directories (empty - user must select)
+        self.source_directories = []
         self.source_path_edit.setText("No directory selected")
             
         # Add some initial log messages
-        self.log_output.append("Skydiving Video Organizer started")
-        self.log_output.append("Please select a source directory and configure settings")
+        self.append_log_lines([
+            "Skydiving Video Organizer started",
+            "Please select a source directory and configure settings",
+            f"Full log: {LOG_FILE}"
+        ])
+        
+    def create_library_tab(self):
+        """Archive browser over the per-date manifests, loaded lazily as the table scrolls."""
+        library_widget = QWidget()
+        library_layout = QVBoxLayout(library_widget)
+        
+        archive_layout = QHBoxLayout()
+        self.library_path_edit = QLineEdit("No archive selected")
+        self.library_path_edit.setReadOnly(True)
+        archive_layout.addWidget(self.library_path_edit, 1)
+        open_archive_btn = QPushButton("Open...")
+        open_archive_btn.clicked.connect(self.browse_library_directory)
+        archive_layout.addWidget(open_archive_btn)
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.load_library)
+        archive_layout.addWidget(refresh_btn)
+        library_layout.addLayout(archive_layout)
+        
+        self.library_model = LibraryModel(self)
+        self.library_model.rowsInserted.connect(lambda *_: self.update_library_status())
+        self.library_view = QTableView()
+        self.library_view.setModel(self.library_model)
+        self.library_view.setSelectionBehavior(QTableView.SelectRows)
+        self.library_view.setWordWrap(False)
+        # Fixed row heights let the view work out what is visible without measuring rows
+        self.library_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.library_view.verticalHeader().setVisible(False)
+        self.library_view.horizontalHeader().setStretchLastSection(True)
+        library_layout.addWidget(self.library_view, 1)
+        
+        self.library_status_label = QLabel()
+        library_layout.addWidget(self.library_status_label)
+        
+        self.library_dir = None
+        return library_widget
+        
+    def browse_library_directory(self):
+        directory = QFileDialog.getExistingDirectory(self, "Select Organized Folder")
+        if directory:
+            self.set_library_dir(Path(directory))
+            
+    def set_library_dir(self, library_dir):
+        """Show an archive in the Library tab, and number new jumps the way it was last regrouped."""
+        self.library_dir = library_dir
+        stored = organize_videos.stored_jump_threshold(library_dir)
+        if stored is not None:
+            minutes = stored.total_seconds() / 60
+            if minutes.is_integer() and self.jump_threshold_spin.minimum() <= minutes <= self.jump_threshold_spin.maximum():
+                self.jump_threshold_spin.setValue(int(minutes))
+            else:
+                # The spin box would silently change it; the CLI keeps using the stored value
+                self.log_output.appendPlainText(f"The archive was regrouped with a {minutes:g} minute threshold, which "
+                                                f"can't be set here - use --jump-threshold on the command line")
+        self.load_library()
+            
+    def load_library(self):
+        if self.library_dir is None:
+            return
+        self.library_path_edit.setText(str(self.library_dir))
+        self.library_model.load(self.library_dir, self.archive_config())
+        if self.library_model.canFetchMore():
+            self.library_model.fetchMore()
+        self.update_library_status()
+        
+    def update_library_status(self):
+        model = self.library_model
+        text = f"{len(model.rows)} clips from {model.next_folder} of {len(model.folders)} date folders"
+        if model.missing:
+            text += (f" - {len(model.missing)} folders have no manifest yet "
+                     f"(organize with 'Renumber jumps in all date folders' to create them)")
+        self.library_status_label.setText(text)
+        
+    def archive_config(self):
+        """Settings for working on the archive shown in the Library tab."""
+        return organize_videos.OrganizerConfig.from_globals(
+            organized_dir=str(self.library_dir),
+            video_extensions=frozenset(ext.strip() for ext in self.extensions_edit.text().split(',')),
+            preserve_names=self.preserve_names_checkbox.isChecked(),
+            container_times_are_utc=self.container_utc_checkbox.isChecked(),
+        )
+        
+    def preview_jump_threshold(self):
+        """Show what a range of jump time thresholds would do to the archive, and offer to apply the chosen one."""
+        if self.library_dir is None or not self.library_dir.is_dir():
+            QMessageBox.warning(self, "Warning", "Please select a source directory or open an archive in the Library tab first.")
+            return
+        chosen = self.jump_threshold_spin.value()
+        thresholds = sorted(set(PREVIEW_THRESHOLDS) | {chosen})
+        config = self.archive_config()
+        
+        def compute():
+            try:
+                timeline = organize_videos.load_archive_timeline(config)
+            except ImportError:
+                raise RuntimeError("The threshold preview needs NumPy (pipenv install).")
+            return organize_videos.preview_thresholds(
+                timeline, [organize_videos.timedelta(minutes=minutes) for minutes in thresholds])
+        self.start_archive_task(compute, lambda preview: self.show_threshold_preview(preview, chosen, thresholds, config))
+        
+    def start_archive_task(self, function, on_done):
+        """Run function in an ArchiveTaskThread, with organizing and other archive steps disabled meanwhile."""
+        if self.archive_thread and self.archive_thread.isRunning():
+            QMessageBox.information(self, "Info", "The archive is still being worked on.")
+            return
+        self.archive_thread = ArchiveTaskThread(function)
+        
+        def finished(result, error):
+            self.preview_threshold_btn.setEnabled(True)
+            self.organize_btn.setEnabled(not (self.organizer_thread and self.organizer_thread.is_running))
+            if error:
+                QMessageBox.warning(self, "Warning", error)
+            else:
+                on_done(result)
+        self.archive_thread.finished_signal.connect(finished)
+        self.preview_threshold_btn.setEnabled(False)
+        self.organize_btn.setEnabled(False)
+        self.archive_thread.start()
+        
+    def show_threshold_preview(self, preview, chosen, thresholds, config):
+        lines = ["Threshold   Jumps   Folders renumbered"]
+        for minutes in thresholds:
+            entry = preview[f"{minutes:g}"]
+            marker = "  <" if minutes == chosen else ""
+            lines.append(f"{minutes:>6} min {entry['jumps']:>7} {entry['changed_folders']:>10}{marker}")
+        lines += ["", f"Jumps per date at {chosen} minutes:"]
+        lines += [f"  {folder}  {count}" for folder, count in preview[f"{chosen:g}"]['folders'].items()]
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Jump Time Threshold Preview")
+        dialog.resize(480, 520)
+        dialog_layout = QVBoxLayout(dialog)
+        text = QPlainTextEdit("\n".join(lines))
+        text.setReadOnly(True)
+        dialog_layout.addWidget(text)
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        apply_btn = buttons.addButton(f"Apply {chosen} min to Archive", QDialogButtonBox.AcceptRole)
+        apply_btn.setEnabled(not (self.organizer_thread and self.organizer_thread.is_running))
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        dialog_layout.addWidget(buttons)
+        if dialog.exec() == QDialog.Accepted:
+            self.apply_jump_threshold(chosen, config)
+            
+    def apply_jump_threshold(self, minutes, config):
+        """Renumber only the date folders whose jumps change with the new threshold."""
+        logger = BufferedLogger(LOG_FILE)
+        self.append_log_lines([f"Renumbering the archive for a {minutes} minute threshold..."])
+        
+        def done(changed):
+            logger.message(f"Renumbered {len(changed)} date folders for a {minutes} minute threshold")
+            self.append_log_lines(logger.take_lines())
+            logger.close()
+            self.load_library()
+        self.start_archive_task(
+            lambda: organize_videos.regroup_archive(organize_videos.timedelta(minutes=minutes),
+                                                    config._replace(logger=logger)), done)
         
     def browse_source_directory(self):
         directory = QFileDialog.getExistingDirectory(self, "Select Source Directory")
         if directory:
-            self.source_directory = directory
+            self.source_directories = [directory]
             self.source_path_edit.setText(directory)
-            self.log_output.append(f"Source directory set to: {directory}")
+            self.append_log_lines([f"Source directory set to: {directory}"])
+            self.set_library_dir(Path(directory) / "organized")
+            
+    def add_source_directory(self):
+        if not self.source_directories:
+            self.browse_source_directory()
+            return
+        directory = QFileDialog.getExistingDirectory(self, "Add Source Directory")
+        if directory and directory not in self.source_directories:
+            self.source_directories.append(directory)
+            self.source_path_edit.setText("; ".join(self.source_directories))
+            self.append_log_lines([f"Added source directory: {directory}"])
             
     def start_organization(self):
-        if not self.source_directory:
+        if not self.source_directories:
             QMessageBox.warning(self, "Warning", "Please select a source directory first.")
             return
             
@@ -395,27 +874,78 @@ class VideoOrganizerGUI(QMainWindow):
             
         # Get configuration
         extensions = [ext.strip() for ext in self.extensions_edit.text().split(',')]
+        reference_time = None
+        if self.reference_time_edit.text().strip():
+            try:
+                reference_time = datetime.strptime(self.reference_time_edit.text().strip(), "%Y-%m-%d %H:%M:%S")
+            except ValueError:
+                QMessageBox.warning(self, "Warning", "Reference time must use the YYYY-MM-DD HH:MM:SS format.")
+                return
         config = {
             'extensions': extensions,
             'jump_threshold': self.jump_threshold_spin.value(),
-            'preserve_names': self.preserve_names_checkbox.isChecked()
+            'preserve_names': self.preserve_names_checkbox.isChecked(),
+            'workers': self.workers_spin.value(),
+            'device_streams': self.device_streams_spin.value(),
+            'scan_subfolders': self.scan_subfolders_checkbox.isChecked(),
+            'renumber_all': self.renumber_all_checkbox.isChecked(),
+            'verify_transfers': self.verify_transfers_checkbox.isChecked(),
+            'container_times_are_utc': self.container_utc_checkbox.isChecked(),
+            'copy_mode': self.copy_mode_checkbox.isChecked(),
+            'thumbnails': self.thumbnails_checkbox.isChecked(),
+            'resume': self.resume_checkbox.isChecked(),
+            'reference_time': reference_time
         }
         
         # Start organization thread
-        self.organizer_thread = VideoOrganizerThread(self.source_directory, config)
-        self.organizer_thread.progress_signal.connect(self.update_log)
+        self.organizer_thread = VideoOrganizerThread(self.source_directories, config)
         self.organizer_thread.finished_signal.connect(self.organization_finished)
+        self.organizer_thread.report_signal.connect(self.show_run_report)
         
         # Update UI
         self.organize_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(True)
+        self.cancel_btn.setText("Cancel")
+        self.cancel_btn.setVisible(True)
         self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)  # Indeterminate progress
+        self.progress_bar.setRange(0, 0)  # Indeterminate until the files are discovered
+        self.progress_label.setText("Scanning...")
+        self.progress_label.setVisible(True)
         
         self.organizer_thread.start()
+        self.log_timer.start()
+        
+    def cancel_organization(self):
+        if self.organizer_thread and self.organizer_thread.is_running:
+            self.organizer_thread.cancel()
+            self.cancel_btn.setEnabled(False)
+            self.cancel_btn.setText("Cancelling...")
+        
+    def update_progress(self):
+        if not self.organizer_thread:
+            return
+        phase, done_files, total_files, done_bytes, total_bytes, elapsed = self.organizer_thread.progress()
+        if not total_files:
+            return
+        self.progress_bar.setRange(0, PROGRESS_STEPS)
+        self.progress_bar.setValue(min(done_bytes * PROGRESS_STEPS // max(total_bytes, 1), PROGRESS_STEPS))
+        text = f"{done_files}/{total_files} files"
+        if phase == "ingest" and 0 < done_bytes < total_bytes:
+            remaining = elapsed * (total_bytes - done_bytes) / done_bytes
+            text += f" - about {int(remaining // 60)}:{int(remaining % 60):02d} left"
+        elif phase:
+            text += f" - {phase}"
+        self.progress_label.setText(text)
         
     def organization_finished(self, success, message):
+        self.log_timer.stop()
+        self.flush_log()
+        self.organizer_thread.logger.close()
         self.organize_btn.setEnabled(True)
+        self.cancel_btn.setVisible(False)
         self.progress_bar.setVisible(False)
+        self.progress_label.setVisible(False)
+        self.load_library()
         
         if success:
             QMessageBox.information(self, "Success", message)
@@ -424,9 +954,35 @@ class VideoOrganizerGUI(QMainWindow):
             
 
             
-    def update_log(self, message):
-        self.log_output.append(f"{datetime.now().strftime('%H:%M:%S')} - {message}")
-        # Auto-scroll to bottom
+    def show_run_report(self, report):
+        lines = ["Cancelled - remaining files were left in place"] if report.get('cancelled') else []
+        for name, stats in report['phases'].items():
+            lines.append(f"{name:<10} {stats['seconds']:>8.2f} s   {stats['files_read']:>6} files   "
+                         f"{stats['bytes_read'] / (1024 * 1024):>9.1f} MB read")
+        moves = report['moves']
+        lines.append(f"Moved {moves['files']} files, {moves['bytes'] / (1024 * 1024):.1f} MB "
+                     f"at {moves['mb_per_second']:.1f} MB/s")
+        lines.append(f"Move latency: p50 {moves['latency_p50']:.2f} s, p90 {moves['latency_p90']:.2f} s, "
+                     f"p99 {moves['latency_p99']:.2f} s, max {moves['latency_max']:.2f} s")
+        if moves.get('methods'):
+            lines.append("Methods: " + ", ".join(f"{method} {count}" for method, count in sorted(moves['methods'].items())))
+        for stats in report.get('devices', {}).values():
+            lines.append(f"Drive {stats['path']}: {stats['bytes'] / (1024 * 1024):.1f} MB at "
+                         f"{stats['mb_per_second']:.1f} MB/s, {stats['streams']} copies, "
+                         f"{stats['metadata_ops']} renames/links, queue up to {stats['max_queue_depth']}, "
+                         f"waited {stats['wait_seconds']:.1f} s")
+        self.summary_label.setText("\n".join(lines))
+        self.summary_group.setVisible(True)
+            
+    def flush_log(self):
+        if self.organizer_thread:
+            lines = self.organizer_thread.take_log_lines()
+            if lines:
+                self.append_log_lines(lines)
+            
+    def append_log_lines(self, lines):
+        self.log_output.appendPlainText("\n".join(lines))
+        # Auto-scroll to bottom, once per batch
         self.log_output.verticalScrollBar().setValue(
             self.log_output.verticalScrollBar().maximum()
         )
@@ -434,6 +990,8 @@ class VideoOrganizerGUI(QMainWindow):
 
 
 def main():
+    # The thumbnail process pool starts copies of the bundled app
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     
     # Set application style